@@ -0,0 +1,40 @@
+"""Compare finding the codification units affected by a statute through a
+scan of the history of every unit of every page with an `AffectorIndex`.
+
+Run with `python benchmarks/bench_affectors.py [copies]`.
+"""
+import sys
+import time
+from pathlib import Path
+
+from statute_trees import AffectorIndex, CodePage, CodeUnit
+
+DATA = Path(__file__).parents[1] / "tests" / "data"
+
+
+def scan(pages: list[CodePage], category: str, serial_id: str) -> list:
+    return [
+        (page.id, unit.id, event.action)
+        for page in pages
+        for unit in CodeUnit.walk(page.tree)
+        for event in unit.history or []
+        if getattr(event, "statute_category", None) == category
+        and event.statute_serial_id == serial_id
+    ]
+
+
+if __name__ == "__main__":
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    page = CodePage.build(DATA / "codification.yaml")
+    pages = [page.copy(update={"id": f"{page.id}-{i}"}) for i in range(copies)]
+
+    started = time.process_time()
+    index = AffectorIndex.from_pages(pages)
+    print(f"{'build index':<12} {time.process_time() - started:10.4f} s")
+    started = time.process_time()
+    scanned = scan(pages, "eo", "292")
+    print(f"{'scan':<12} {time.process_time() - started:10.4f} s")
+    started = time.process_time()
+    found = index.by_serial("eo", "292")
+    print(f"{'lookup':<12} {time.process_time() - started:10.4f} s")
+    assert sorted(found) == sorted(scanned)
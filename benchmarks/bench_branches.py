@@ -0,0 +1,105 @@
+"""Compare the former recursive tree builders with their explicit-stack
+replacements on synthetic trees that are either very deep or very wide.
+
+Run with `python benchmarks/bench_branches.py [depth] [width]`.
+"""
+import sys
+import timeit
+from collections.abc import Callable
+from functools import partial
+
+from statute_trees import StatuteUnit
+from statute_trees.utils import Layers, set_node_ids
+
+
+def deep_tree(depth: int, labeled: bool = True) -> list[dict]:
+    """A single chain of `depth` units; unless `labeled`, the last unit has
+    no `item` for `layerize()` to fill."""
+    root: dict = {"item": "Item 1", "content": "Text"}
+    node = root
+    for i in range(2, depth + 1):
+        node["units"] = [{"item": f"Item {i}", "content": "Text"}]
+        node = node["units"][0]
+    if not labeled:
+        del node["item"]
+    return [root]
+
+
+def wide_tree(width: int, labeled: bool = True) -> list[dict]:
+    """A single level of `width` units, each with a pair of children which,
+    unless `labeled`, have no `item` for `layerize()` to fill."""
+    return [
+        {
+            "item": f"Item {i}",
+            "units": [
+                {"content": "Text", **({"item": "A"} if labeled else {})},
+                {"caption": "Caption", **({"item": "B"} if labeled else {})},
+            ],
+        }
+        for i in range(1, width + 1)
+    ]
+
+
+def recursive_set_node_ids(nodes, parent_id="1.", child_key="units"):
+    for counter, node in enumerate(nodes, start=1):
+        node["id"] = f"{parent_id}{str(counter)}."
+        if node.get(child_key, None):
+            recursive_set_node_ids(node[child_key], node["id"], child_key)
+
+
+def recursive_layerize(nodes, level=1):
+    flag = False
+    for idx, node in enumerate(nodes, start=0):
+        if "item" not in node:
+            category = Layers.DEFAULT.get_item_type(level).value
+            node["item"] = f"§{category[idx]}"
+            flag = True
+        if node.get("units"):
+            recursive_layerize(node["units"], level + 1 if flag else level)
+
+
+def recursive_create_branches(units, parent_id="1."):
+    for counter, u in enumerate(units, start=1):
+        children = []
+        id = f"{parent_id}{str(counter)}."
+        if subunits := u.pop("units", None):
+            children = list(recursive_create_branches(subunits, id))
+        yield StatuteUnit(**u, id=id, units=children)
+
+
+CASES = {
+    "set_node_ids": (recursive_set_node_ids, set_node_ids),
+    "layerize": (recursive_layerize, Layers.DEFAULT.layerize),
+    "create_branches": (
+        lambda t: list(recursive_create_branches(t)),
+        lambda t: list(StatuteUnit.create_branches(t)),
+    ),
+}
+
+
+def measure(fn, make_tree: Callable[[], list[dict]], number: int = 3):
+    """Fresh trees are made for each call since the builders mutate them;
+    `copy.deepcopy()` would itself exceed the recursion limit."""
+    trees = [make_tree() for _ in range(number)]
+    try:
+        elapsed = timeit.timeit(lambda: fn(trees.pop()), number=number)
+    except RecursionError:
+        return f"{'RecursionError':>14}"
+    return f"{elapsed / number * 1e3:11.1f} ms"
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    depth, width = args + [500, 10000][len(args) :]
+    for label, make_tree in (
+        (f"depth={depth}", lambda labeled: deep_tree(depth, labeled)),
+        (f"depth={depth * 4}", lambda labeled: deep_tree(depth * 4, labeled)),
+        (f"width={width}", lambda labeled: wide_tree(width, labeled)),
+    ):
+        for name, (before, after) in CASES.items():
+            labeled = name != "layerize"
+            tree = partial(make_tree, labeled)
+            print(
+                f"{label:<12} {name:<16} recursive {measure(before, tree)}"
+                f"  iterative {measure(after, tree)}"
+            )
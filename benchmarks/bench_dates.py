@@ -0,0 +1,42 @@
+"""Compare `dateutil.parser.parse()` with the memoized `cached_date()` on
+the kinds of dates found in event histories.
+
+Run with `python benchmarks/bench_dates.py [repeats]`.
+"""
+import sys
+import timeit
+
+from dateutil.parser import parse
+
+from statute_trees.memo import cached_date
+
+DATES = [
+    "2010-03-09",
+    "October 15, 1986",
+    "Oct. 15, 1986",
+    "15 October 1986",
+    "Sept. 5, 2000",
+]
+
+
+def uncached():
+    for text in DATES:
+        cached_date.__wrapped__(text)
+
+
+def cached():
+    for text in DATES:
+        cached_date(text)
+
+
+def dateutil():
+    for text in DATES:
+        parse(text).date()
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    for fn in (dateutil, uncached, cached):
+        elapsed = timeit.timeit(fn, number=repeats)
+        per = elapsed / (repeats * len(DATES)) * 1e6
+        print(f"{fn.__name__:<10} {per:8.2f} µs per date")
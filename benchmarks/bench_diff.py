@@ -0,0 +1,65 @@
+"""Compare finding the changed material paths between two versions of a
+large tree by comparing every node of their `units` json with the Merkle
+hashes of `TreeHashes` and `diff_trees()`.
+
+Run with `python benchmarks/bench_diff.py [chapters] [sections]`.
+"""
+import copy
+import json
+import sys
+import time
+
+from statute_trees.utils import TreeHashes, diff_trees, set_node_ids
+
+
+def make_tree(chapters: int, sections: int) -> list[dict]:
+    units = [
+        {
+            "item": f"Chapter {c}",
+            "units": [
+                {"item": f"Section {s}", "content": f"Text of {c}.{s}."}
+                for s in range(1, sections + 1)
+            ],
+        }
+        for c in range(1, chapters + 1)
+    ]
+    set_node_ids(units)
+    return units
+
+
+def compare_all(old: str, new: str) -> set[str]:
+    """The node by node comparison of the `units` json that the hashes
+    replace: every node of both versions is visited."""
+
+    def flatten(units: list[dict]) -> dict[str, dict]:
+        nodes, stack = {}, list(units)
+        while stack:
+            node = stack.pop()
+            stack.extend(node.get("units") or [])
+            nodes[node["id"]] = {k: v for k, v in node.items() if k != "units"}
+        return nodes
+
+    a, b = flatten(json.loads(old)), flatten(json.loads(new))
+    return {k for k in a.keys() | b.keys() if a.get(k) != b.get(k)}
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    chapters, sections = args + [20, 1000][len(args) :]
+    old = make_tree(chapters, sections)
+    new = copy.deepcopy(old)
+    new[3]["units"][10]["content"] = "Changed."
+    new[-1]["units"].append({"item": "Section 0", "content": "New."})
+    set_node_ids(new)
+    old_json, new_json = json.dumps(old), json.dumps(new)
+
+    started = time.process_time()
+    changed = compare_all(old_json, new_json)
+    print(f"{'compare all':<12} {time.process_time() - started:8.3f} s")
+    started = time.process_time()
+    old_hashes, new_hashes = TreeHashes(old), TreeHashes(new)
+    print(f"{'hash both':<12} {time.process_time() - started:8.3f} s")
+    started = time.process_time()
+    diff = diff_trees(old_hashes, new_hashes)
+    print(f"{'diff':<12} {time.process_time() - started:8.3f} s")
+    assert {p for _, p in diff.modified} | set(diff.added) == changed
@@ -0,0 +1,69 @@
+"""Compare `json.dumps(tree.dict(exclude_none=True))` with `dump_units()` on
+a synthetic codification with history.
+
+Run with `python benchmarks/bench_dump.py [articles]`.
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from statute_trees import CodeUnit
+from statute_trees.utils import dump_units
+
+HISTORY = [
+    {
+        "statute_category": "ra",
+        "statute_serial_id": "386",
+        "locator": "Article 1",
+        "statute": "Republic Act No. 386",
+        "action": "Originated",
+    }
+]
+
+
+def make_tree(count: int) -> CodeUnit:
+    content = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+    return CodeUnit.construct(
+        id="1.",
+        item="Synthetic Code",
+        units=[
+            CodeUnit(
+                id=f"1.{i}.",
+                item=f"Article {i}",
+                caption=f"Caption of article {i}.",
+                history=HISTORY,
+                units=[
+                    CodeUnit(
+                        id=f"1.{i}.{j}.",
+                        item=f"Paragraph {j}",
+                        content=content,
+                    )
+                    for j in range(1, 4)
+                ],
+            )
+            for i in range(1, count + 1)
+        ],
+    )
+
+
+def measure(label: str, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()  # traced separately since tracing slows the run
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<16} {elapsed:8.3f}s {peak / 2**20:10.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    tree = make_tree(count)
+    assert dump_units([tree]) == json.dumps([tree.dict(exclude_none=True)])
+    measure(
+        "dict + dumps",
+        lambda: json.dumps([tree.dict(exclude_none=True)]),
+    )
+    measure("dump_units", lambda: dump_units([tree]))
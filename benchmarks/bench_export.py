@@ -0,0 +1,47 @@
+"""Compare inserting the rows of many pages one statement at a time, each in
+its own transaction and with indexes in place, with `export_pages()`.
+
+Run with `python benchmarks/bench_export.py [copies]`.
+"""
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from statute_trees import CodePage, export_pages
+from statute_trees.export import page_row, page_spec, unit_rows, unit_spec
+
+DATA = Path(__file__).parents[1] / "tests" / "data"
+
+
+def row_by_row(db: Path, pages: list[CodePage]):
+    specs = page_spec(CodePage), unit_spec(CodePage)
+    with sqlite3.connect(db, isolation_level=None) as conn:
+        for spec in specs:
+            conn.execute(spec.create)
+            for stmt in spec.indexes + spec.fts[:1]:
+                conn.execute(stmt)
+        for page in pages:
+            conn.execute(specs[0].insert, page_row(page, specs[0]))
+            for row in unit_rows(page, specs[1]):
+                conn.execute(specs[1].insert, row)
+        conn.execute(specs[0].fts[1])
+        conn.execute(specs[1].fts[1])
+    conn.close()
+
+
+def bulk(db: Path, pages: list[CodePage]):
+    export_pages(db, CodePage, pages)
+
+
+if __name__ == "__main__":
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    page = CodePage.build(DATA / "codification.yaml")
+    pages = [page.copy(update={"id": f"{page.id}-{i}"}) for i in range(copies)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for fn in (row_by_row, bulk):
+            db = Path(tmp) / f"{fn.__name__}.db"
+            started = time.perf_counter()
+            fn(db, pages)
+            print(f"{fn.__name__:<12} {time.perf_counter() - started:8.3f} s")
@@ -0,0 +1,73 @@
+"""Compare building the units of a large document, then serializing them and
+creating their searchable rows in separate passes, with the fused pipeline
+of a `DocPage.build(fused=True)`.
+
+Run with `python benchmarks/bench_fused.py [sections]`.
+"""
+import copy
+import sys
+import time
+
+from statute_trees import DocUnit
+from statute_trees.utils import dump_units
+
+
+def make_document(sections: int) -> dict:
+    source = {"statute": "Executive Order No. 292", "locator": "8"}
+    return {
+        "title": "Large Document",
+        "description": "Synthetic document for benchmarking.",
+        "date": "January 1, 2023",
+        "units": [
+            {
+                "item": f"Part {i}",
+                "caption": "Part",
+                "units": [
+                    {
+                        "caption": f"Chapter {j}",
+                        "units": [
+                            {
+                                "content": f"Paragraph {k} of chapter {j}.",
+                                "sources": [source],
+                            }
+                            for k in range(1, 6)
+                        ],
+                    }
+                    for j in range(1, 11)
+                ],
+            }
+            for i in range(1, sections + 1)
+        ],
+    }
+
+
+def separate(units: list[dict]):
+    tree = list(DocUnit.create_branches(units))
+    return dump_units(tree), list(DocUnit.searchables("pk", tree))
+
+
+def fused(units: list[dict]):
+    fused = DocUnit.fuse_branches(units, "pk")
+    return dump_units(fused.units), fused.rows
+
+
+def measure(fns: list, units: list[dict], repeat: int = 7) -> list[float]:
+    """Best cpu time of each of the `fns`, interleaved to even out noise and
+    each run on a fresh copy since the units are mutated."""
+    best = [float("inf")] * len(fns)
+    for _ in range(repeat):
+        for i, fn in enumerate(fns):
+            data = copy.deepcopy(units)
+            started = time.process_time()
+            fn(data)
+            best[i] = min(best[i], time.process_time() - started)
+    return best
+
+
+if __name__ == "__main__":
+    sections = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    data = make_document(sections)
+    units = data["units"]
+    assert separate(copy.deepcopy(units)) == fused(copy.deepcopy(units))
+    for fn, elapsed in zip(fns := [separate, fused], measure(fns, units)):
+        print(f"{fn.__name__:<10} {elapsed:8.3f} s")
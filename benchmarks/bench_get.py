@@ -0,0 +1,58 @@
+"""Compare a full depth-first search, formerly done by `get_node_id()`, with
+positional descent, the batch `get_node_ids()` and a prebuilt `TreeIndex`
+on a large tree.
+
+Run with `python benchmarks/bench_get.py [width] [depth] [queries]`.
+"""
+import random
+import sys
+import timeit
+
+from statute_trees.utils import (
+    TreeIndex,
+    get_node_id,
+    get_node_ids,
+    set_node_ids,
+)
+from statute_trees.utils.get import _search
+
+
+def make_tree(width: int, depth: int) -> list[dict]:
+    def branch(level: int) -> list[dict]:
+        nodes = [{"item": f"Item {i}"} for i in range(1, width + 1)]
+        if level < depth:
+            for node in nodes:
+                node["units"] = branch(level + 1)
+        return nodes
+
+    tree = branch(1)
+    set_node_ids(tree)
+    return tree
+
+
+def search(nodes: list[dict], query_id: str) -> dict | None:
+    for node in _search(nodes, "units"):
+        if node["id"] == query_id:
+            return node
+    return None
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:4]]
+    width, depth, count = args + [6, 6, 50][len(args) :]
+    tree = make_tree(width, depth)
+    ids = [n["id"] for n in _search(tree, "units")]
+    queries = random.Random(0).sample(ids, count)
+    print(f"{len(ids)} nodes, {count} queries")
+    started = timeit.default_timer()
+    index = TreeIndex.from_nodes(tree)
+    print(f"index built in {(timeit.default_timer() - started) * 1e3:.1f} ms")
+    cases = {
+        "search": lambda: [search(tree, q) for q in queries],
+        "descend": lambda: [get_node_id(tree, q) for q in queries],
+        "batch": lambda: get_node_ids(tree, queries),
+        "index": lambda: [index[q] for q in queries],
+    }
+    for name, fn in cases.items():
+        elapsed = min(timeit.repeat(fn, number=5, repeat=3)) / 5
+        print(f"{name:<8} {elapsed * 1e3:10.3f} ms per {count} queries")
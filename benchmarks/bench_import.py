@@ -0,0 +1,35 @@
+"""Cold import times, per `python -X importtime`, of the entry points used by
+short-lived jobs.
+
+Run with `python benchmarks/bench_import.py`.
+"""
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import statute_trees",
+    "from statute_trees.utils import get_node_id",
+    "from statute_trees import StatutePage",
+    "from statute_trees import CodePage, DocPage",
+]
+
+
+def cumulative_us(statement: str) -> int:
+    """Sum of the cumulative times of the outermost imports."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in proc.stderr.splitlines()[1:]:  # skips the header
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):  # nested imports are indented
+            total += int(cumulative)
+    return total
+
+
+if __name__ == "__main__":
+    for statement in STATEMENTS:
+        print(f"{statement:<48} {cumulative_us(statement) / 1000:8.1f} ms")
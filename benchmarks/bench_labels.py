@@ -0,0 +1,60 @@
+"""Compare resolving statute locators by walking the statute's tree for
+each locator with a `LocatorResolver` built once over the statute pages,
+then the same for prefix queries, e.g. "Section 1*", with `Page.labels`.
+
+Run with `python benchmarks/bench_labels.py [events]`.
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+from statute_trees import LocatorResolver, StatutePage, StatuteUnit
+from statute_trees.labels import fold_label
+
+DATA = Path(__file__).parents[1] / "tests" / "data"
+
+
+def walk(page: StatutePage, locator: str) -> list[str]:
+    label = fold_label(locator)
+    return [
+        u.id
+        for u in StatuteUnit.walk(page.tree)
+        if fold_label(u.item) == label
+    ]
+
+
+if __name__ == "__main__":
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    page = StatutePage.build(
+        DATA / "statutes" / "const" / "1987" / "details.yaml"
+    )
+    items = [u.item for u in StatuteUnit.walk(page.tree)]
+    locators = [random.choice(items) for _ in range(events)]
+
+    started = time.process_time()
+    walked = [walk(page, loc) for loc in locators]
+    print(f"{'walk':<8} {time.process_time() - started:8.3f} s")
+    started = time.process_time()
+    resolver = LocatorResolver.from_pages([page])
+    found = [resolver.resolve("const", "1987", loc) for loc in locators]
+    print(f"{'index':<8} {time.process_time() - started:8.3f} s")
+    assert found == walked
+
+    prefixes = [
+        f"Section {random.randint(1, 30)}" for _ in range(events // 10)
+    ]
+    started = time.process_time()
+    walked = [
+        [
+            u.id
+            for u in StatuteUnit.walk(page.tree)
+            if fold_label(u.item).startswith(fold_label(p))
+        ]
+        for p in prefixes
+    ]
+    print(f"{'walk*':<8} {time.process_time() - started:8.3f} s")
+    started = time.process_time()
+    found = [page.labels.find(f"{p}*") for p in prefixes]
+    print(f"{'index*':<8} {time.process_time() - started:8.3f} s")
+    assert found == walked
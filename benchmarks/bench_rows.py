@@ -0,0 +1,54 @@
+"""Compare flattening a statute tree into rows via the former recursive
+`granularize()` and via `searchables()` with the tuple rows of `rows()`.
+
+Run with `python benchmarks/bench_rows.py [depth] [width]`.
+"""
+import sys
+import time
+
+from statute_trees import StatuteUnit
+
+
+def make_tree(depth: int, width: int) -> list[StatuteUnit]:
+    """`width` chains of `depth` units each."""
+    units = []
+    for w in range(1, width + 1):
+        root: dict = {"item": f"Article {w}", "content": "Text " * 50}
+        node = root
+        for d in range(2, depth + 1):
+            node["units"] = [{"item": f"Section {d}", "caption": "Caption"}]
+            node = node["units"][0]
+        units.append(root)
+    return list(StatuteUnit.create_branches(units))
+
+
+def recursive_granularize(pk, nodes):
+    for i in nodes:
+        data = i.dict()
+        data["statute_id"] = pk
+        data["material_path"] = data.pop("id")
+        yield dict(**data)
+        if i.units:
+            yield from recursive_granularize(pk, i.units)
+
+
+CASES = {
+    "granularize (recursive)": recursive_granularize,
+    "granularize": StatuteUnit.granularize,
+    "searchables": StatuteUnit.searchables,
+    "rows": StatuteUnit.rows,
+}
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    depth, width = args + [100, 50][len(args) :]
+    tree = make_tree(depth, width)
+    for name, fn in CASES.items():
+        best = float("inf")
+        for _ in range(3):
+            started = time.process_time()
+            for _ in fn("pk", tree):
+                pass
+            best = min(best, time.process_time() - started)
+        print(f"{name:<24} {best * 1e3:10.1f} ms")
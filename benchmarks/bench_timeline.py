@@ -0,0 +1,72 @@
+"""Compare answering successive "as of" queries over a codification by
+replaying the history of every unit per query with a `Timeline`.
+
+Run with `python benchmarks/bench_timeline.py [articles] [queries]`.
+"""
+import datetime
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from statute_trees import CodePage, Timeline
+
+
+def make_code(articles: int) -> dict:
+    def article(i: int) -> dict:
+        history = []
+        if i % 3 == 0:
+            year = 2000 + i % 20
+            history.append(
+                dict(
+                    locator=f"Section {i}",
+                    statute="Republic Act No. 386",
+                    action=random.choice(["Inserted", "Repealed", "Amended"]),
+                    date=f"January {1 + i % 28}, {year}",
+                )
+            )
+        return {
+            "item": f"Article {i}",
+            "content": "Text.",
+            "history": history or None,
+            "units": [{"item": "Paragraph 1", "content": "Text."}],
+        }
+
+    return {
+        "title": "Synthetic Code",
+        "description": "Synthetic codification for benchmarking.",
+        "date": "January 1, 1999",
+        "base": "Republic Act No. 386",
+        "units": [article(i) for i in range(1, articles + 1)],
+    }
+
+
+def replay(page: CodePage, date: datetime.date) -> list[str]:
+    """The ad hoc computation that a `Timeline` replaces."""
+    return Timeline(page).as_of(date)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    articles, queries = args + [10000, 200][len(args) :]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "code.yaml"
+        path.write_text(yaml.safe_dump(make_code(articles)))
+        page = CodePage.build(path)
+    start = datetime.date(1999, 1, 1).toordinal()
+    dates = [
+        datetime.date.fromordinal(start + random.randint(0, 365 * 25))
+        for _ in range(queries)
+    ]
+
+    started = time.process_time()
+    replayed = [replay(page, d) for d in dates]
+    print(f"{'replay':<10} {time.process_time() - started:8.3f} s")
+    started = time.process_time()
+    timeline = Timeline(page)
+    found = [timeline.as_of(d) for d in dates]
+    print(f"{'timeline':<10} {time.process_time() - started:8.3f} s")
+    assert found == replayed
@@ -0,0 +1,29 @@
+"""Compare one `fetch_values_from_key()` scan per key with a single
+`walk_keys()` traversal, with and without restricting it to the units.
+
+Run with `python benchmarks/bench_walk.py [copies]`.
+"""
+import sys
+import timeit
+from pathlib import Path
+
+from statute_trees.utils import fetch_values_from_key, load_yaml, walk_keys
+
+KEYS = ("history", "sources", "faq")
+SAMPLE = Path(__file__).parents[1] / "tests" / "data" / "codification.yaml"
+
+
+if __name__ == "__main__":
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    units = load_yaml(SAMPLE)["units"] * copies
+    data = {"units": units}
+    cases = {
+        "fetch per key": lambda: [
+            list(fetch_values_from_key(data, key)) for key in KEYS
+        ],
+        "walk all": lambda: list(walk_keys(data, KEYS)),
+        "walk units": lambda: list(walk_keys(units, KEYS, child_key="units")),
+    }
+    for name, fn in cases.items():
+        elapsed = min(timeit.repeat(fn, number=3, repeat=3)) / 3
+        print(f"{name:<14} {elapsed * 1e3:8.1f} ms")
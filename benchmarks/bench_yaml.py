@@ -0,0 +1,66 @@
+"""Compare the yaml loading paths available to `CodePage.build()`.
+
+Run with `python benchmarks/bench_yaml.py [units]`; a synthetic codification
+is generated in a temporary folder.
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import yaml
+
+from statute_trees.utils import iter_units, load_header, load_yaml
+
+
+def make_codification(folder: Path, count: int) -> Path:
+    content = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+    units = [
+        {
+            "item": f"Article {i}",
+            "caption": f"Caption of article {i}.",
+            "units": [
+                {"item": f"Paragraph {j}", "content": content}
+                for j in range(1, 4)
+            ],
+        }
+        for i in range(1, count + 1)
+    ]
+    data = {
+        "title": "Synthetic Code",
+        "description": "Generated for benchmarks.",
+        "date": "January 1, 2000",
+        "base": "Republic Act No. 386",
+        "units": units,
+    }
+    target = folder / "synthetic.yaml"
+    target.write_text(yaml.safe_dump(data, width=1000))
+    return target
+
+
+def measure(label: str, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()  # traced separately since tracing slows the run
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<24} {elapsed:8.3f}s {peak / 2**20:10.1f} MiB peak")
+
+
+def consume(file_path: Path):
+    load_header(file_path)
+    for _ in iter_units(file_path):
+        pass
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as tmp:
+        p = make_codification(Path(tmp), count)
+        print(f"{p.stat().st_size / 2**20:.1f} MiB, {count} articles")
+        measure("yaml.safe_load", lambda: yaml.safe_load(p.read_text()))
+        measure("load_yaml (C loader)", lambda: load_yaml(p))
+        measure("load_header+iter_units", lambda: consume(p))
@@ -1,20 +1,66 @@
 __version__ = "0.1.5"
 
-from .nodes_codification import CodePage, CodeUnit
-from .nodes_document import DocPage, DocUnit
-from .nodes_statute import MentionedStatute, StatutePage, StatuteUnit
-from .resources import (
-    CitationAffector,
-    EventCitation,
-    EventStatute,
-    Identifier,
-    Node,
-    Page,
-    StatuteAffector,
-    StatuteBase,
-    generic_content,
-    generic_email,
-    generic_mp,
-    generic_variant,
-)
-from .utils import set_node_ids
+from .lazy import TYPE_CHECKING, lazy_exports
+
+if TYPE_CHECKING:
+    from .affectors import AffectorIndex
+    from .corpus import BuildResult, build_corpus
+    from .export import export_pages
+    from .labels import LocatorResolver
+    from .logs import configure_logging
+    from .nodes_codification import CodePage, CodeUnit
+    from .nodes_document import DocPage, DocUnit
+    from .nodes_statute import MentionedStatute, StatutePage, StatuteUnit
+    from .resources import (
+        CitationAffector,
+        EventCitation,
+        EventStatute,
+        Identifier,
+        Node,
+        Page,
+        StatuteAffector,
+        StatuteBase,
+        generic_content,
+        generic_email,
+        generic_mp,
+        generic_variant,
+    )
+    from .timeline import Timeline
+    from .utils import set_node_ids
+
+_EXPORTS = {
+    "AffectorIndex": ".affectors",
+    "BuildResult": ".corpus",
+    "build_corpus": ".corpus",
+    "export_pages": ".export",
+    "LocatorResolver": ".labels",
+    "configure_logging": ".logs",
+    "CodePage": ".nodes_codification",
+    "CodeUnit": ".nodes_codification",
+    "DocPage": ".nodes_document",
+    "DocUnit": ".nodes_document",
+    "MentionedStatute": ".nodes_statute",
+    "StatutePage": ".nodes_statute",
+    "StatuteUnit": ".nodes_statute",
+    "CitationAffector": ".resources",
+    "EventCitation": ".resources",
+    "EventStatute": ".resources",
+    "Identifier": ".resources",
+    "Node": ".resources",
+    "Page": ".resources",
+    "StatuteAffector": ".resources",
+    "StatuteBase": ".resources",
+    "generic_content": ".resources",
+    "generic_email": ".resources",
+    "generic_mp": ".resources",
+    "generic_variant": ".resources",
+    "Timeline": ".timeline",
+    "set_node_ids": ".utils",
+}
+"""Exported names are only imported on first access so that `import
+statute_trees` does not load pydantic, statute-patterns, citation-utils, etc.
+until a code path actually needs them."""
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
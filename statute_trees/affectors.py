@@ -0,0 +1,158 @@
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from .memo import cached_citation, cached_rule
+from .resources import Page, normalize_sec
+from .utils import get_field, walk_keys
+
+
+class Affected(NamedTuple):
+    """A codification unit affected by a statute or a citation."""
+
+    codification_id: str
+    material_path: str
+    action: str | None
+
+
+class AffectorIndex:
+    """Reverse index of the `history` of codification units: from each
+    statute (its category, serial id and locator) and from each citation to
+    the units it affected, so that finding the provisions affected by, e.g.
+    Republic Act No. 10572, is a dictionary lookup instead of a scan of
+    every unit of every `CodePage`.
+
+    Pages are added one at a time, re-adding a page replaces its prior
+    entries, and the index can be saved to and loaded from a json file.
+    Statutes that could not be matched to a category and serial id are not
+    indexed.
+    """
+
+    __slots__ = ("statutes", "citations", "pages")
+
+    def __init__(self):
+        self.statutes: dict[tuple[str, str], dict[str, list[Affected]]] = {}
+        """(category, serial id) to locator to the affected units."""
+        self.citations: dict[str, list[Affected]] = {}
+        """Normalized citation to the affected units."""
+        self.pages: dict[str, list[tuple]] = {}
+        """Codification id to its keys, see `remove()`."""
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Page]) -> "AffectorIndex":
+        index = cls()
+        for page in pages:
+            index.add(page)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def __contains__(self, codification_id: str) -> bool:
+        return codification_id in self.pages
+
+    def add(self, page: Page):
+        """Index the events of the units of a `CodePage`, read from its
+        `tree` or `units` json, see `Page.raw_units()`."""
+        self.add_units(page.id, page.raw_units())
+
+    def add_units(self, codification_id: str, units: list):
+        """Index the events of the `units` (models or dicts) of the
+        codification; see `add()`."""
+        self.remove(codification_id)
+        keys = self.pages[codification_id] = []
+        for hit in walk_keys(units, "history", child_key="units"):
+            for event in hit.value:
+                action = get_field(event, "action")
+                affected = Affected(codification_id, hit.material_path, action)
+                if citation := get_field(event, "citation"):
+                    self.citations.setdefault(citation, []).append(affected)
+                    keys.append((citation,))
+                    continue
+                cat = get_field(event, "statute_category")
+                serial = get_field(event, "statute_serial_id")
+                if not cat or not serial:
+                    continue
+                locator = get_field(event, "locator") or ""
+                serials = self.statutes.setdefault((cat, serial), {})
+                serials.setdefault(locator, []).append(affected)
+                keys.append((cat, serial, locator))
+
+    def remove(self, codification_id: str):
+        """Drop the entries of the codification, if indexed."""
+        for key in set(self.pages.pop(codification_id, [])):
+            if len(key) == 1:
+                entries, bucket = self.citations, key[0]
+            else:
+                entries, bucket = self.statutes[key[:2]], key[2]
+            kept = [a for a in entries[bucket] if a[0] != codification_id]
+            if kept:
+                entries[bucket] = kept
+            else:
+                del entries[bucket]
+                if len(key) > 1 and not entries:
+                    del self.statutes[key[:2]]
+
+    def by_serial(
+        self, category: str, serial_id: str, locator: str | None = None
+    ) -> list[Affected]:
+        """Units affected by the statute, e.g. ("ra", "10572"); limited to a
+        single provision of the statute, e.g. "Section 1", if a `locator` is
+        given."""
+        serials = self.statutes.get((category.lower(), serial_id.lower()), {})
+        if locator is not None:
+            return list(serials.get(normalize_sec(locator), []))
+        return [a for affected in serials.values() for a in affected]
+
+    def by_statute(
+        self, statute: str, locator: str | None = None
+    ) -> list[Affected]:
+        """Units affected by the `statute` text, e.g. "Republic Act No.
+        10572", matched to its category and serial id as the events of
+        the codification were; see `by_serial()`."""
+        if not (rule := cached_rule(statute)):
+            return []
+        return self.by_serial(rule.cat, rule.id, locator)
+
+    def by_citation(self, citation: str) -> list[Affected]:
+        """Units affected by the decision with the `citation`, normalized as
+        the events of the codification were."""
+        if isinstance(key := cached_citation(citation), Exception):
+            return []
+        return list(self.citations.get(key, []))
+
+    def save(self, target: Path) -> Path:
+        """Write the index as a json file of flat rows, one per event."""
+        statutes = [
+            [cat, serial, locator, *a]
+            for (cat, serial), serials in self.statutes.items()
+            for locator, affected in serials.items()
+            for a in affected
+        ]
+        citations = [
+            [citation, *a]
+            for citation, affected in self.citations.items()
+            for a in affected
+        ]
+        data = dict(
+            pages=list(self.pages), statutes=statutes, citations=citations
+        )
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(data, separators=(",", ":")))
+        return target
+
+    @classmethod
+    def load(cls, target: Path) -> "AffectorIndex":
+        """Read the json file made by `save()`."""
+        data = json.loads(target.read_text())
+        index = cls()
+        index.pages = {pk: [] for pk in data["pages"]}
+        for cat, serial, locator, *row in data["statutes"]:
+            serials = index.statutes.setdefault((cat, serial), {})
+            serials.setdefault(locator, []).append(Affected(*row))
+            index.pages[row[0]].append((cat, serial, locator))
+        for citation, *row in data["citations"]:
+            index.citations.setdefault(citation, []).append(Affected(*row))
+            index.pages[row[0]].append((citation,))
+        return index
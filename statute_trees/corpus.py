@@ -0,0 +1,163 @@
+import os
+from collections.abc import Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from contextlib import nullcontext
+from pathlib import Path
+from typing import NamedTuple
+
+from .logs import ErrorCollector, ErrorReport, collecting
+from .logs import collector as default_collector
+from .manifest import BuildManifest, ManifestEntry
+from .nodes_codification import CodePage
+from .nodes_document import DocPage
+from .nodes_statute import StatutePage
+from .resources import Page
+
+PAGE_PATTERNS: dict[type[Page], str] = {
+    StatutePage: "**/details.yaml",
+    CodePage: "**/*.yaml",
+    DocPage: "**/*.yaml",
+}
+"""Default glob pattern, relative to the corpus root, of the files that
+each `build()` classmethod expects. Statutes are sourced from their
+`details.yaml` (see `statute_patterns.Rule.get_details`) whereas
+codifications and documents are a single yaml file each."""
+
+
+class BuildResult(NamedTuple):
+    """The outcome of building a single file. When the build fails, `page`
+    is `None` and `error` contains the reason; the exception itself is not
+    passed along since it may not survive pickling between processes.
+    Non-fatal errors recorded while building, e.g. bad codification events,
+    are summarized in `issues`."""
+
+    path: Path
+    page: Page | None = None
+    error: str | None = None
+    cached: bool = False
+    issues: ErrorReport | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.page is not None
+
+
+def discover(root: Path, pattern: str) -> list[Path]:
+    """Sorted list of files under the `root` that match the glob `pattern`,
+    sorting ensures that ordered builds are reproducible across runs."""
+    return sorted(p for p in root.glob(pattern) if p.is_file())
+
+
+def build_file(page_cls: type[Page], path: Path) -> BuildResult:
+    """Calls the `build()` classmethod of the `page_cls` on the `path`,
+    capturing any exception raised so that a single bad file does not abort
+    the entire corpus."""
+    with collecting(str(path)) as errors:
+        try:
+            page = page_cls.build(path)  # type: ignore
+        except Exception as e:
+            page, error = None, f"{type(e).__name__}: {e}"
+        else:
+            error = None if page else "No page built from file."
+    issues = errors.report()
+    return BuildResult(
+        path, page, error, issues=issues if issues.total else None
+    )
+
+
+def build_corpus(
+    page_cls: type[Page],
+    root: Path,
+    pattern: str | None = None,
+    workers: int | None = None,
+    ordered: bool = True,
+    chunk: int = 4,
+    manifest: BuildManifest | None = None,
+    collector: ErrorCollector | None = None,
+) -> Iterator[BuildResult]:
+    """Discover files under the `root` and build a `page_cls` from each,
+    spreading the work across a pool of processes.
+
+    Results are streamed as they become available so that callers can
+    persist pages without holding the entire corpus in memory.
+
+    Args:
+        page_cls (type[Page]): One of `StatutePage`, `CodePage`, `DocPage`
+        root (Path): The directory containing the files to build
+        pattern (str | None, optional): Glob pattern relative to `root`.
+            Defaults to the pattern in `PAGE_PATTERNS` for the `page_cls`.
+        workers (int | None, optional): Number of processes. Defaults to
+            the number of cpus; `1` builds serially in the current process.
+        ordered (bool, optional): Yield results in the sorted order of the
+            discovered files; otherwise yield in order of completion.
+            Defaults to True.
+        chunk (int, optional): Pending builds kept per worker; bounds the
+            memory used by finished but unconsumed results. Defaults to 4.
+        manifest (BuildManifest | None, optional): When supplied, files
+            whose contents are unchanged since the last build reuse their
+            prior pages (flagged as `cached`) and newly built pages are
+            recorded; the manifest is saved once all results have been
+            consumed. Defaults to None.
+        collector (ErrorCollector | None, optional): Absorbs the `issues`
+            of each result, logging their samples in this process, so that
+            `collector.report()` summarizes the errors of the entire corpus.
+            Defaults to None, i.e. the default `logs.collector`.
+
+    Yields:
+        Iterator[BuildResult]: One result per discovered file.
+    """
+    paths = discover(root, pattern or PAGE_PATTERNS[page_cls])
+    workers = workers or os.cpu_count() or 1
+    entries: dict[Path, ManifestEntry] = {}
+    if manifest:
+        manifest.prune()
+
+    def start(path: Path) -> Future:
+        if manifest:
+            entry = manifest.entry(page_cls, path)
+            if page := manifest.fetch(path, entry):
+                return _resolved(BuildResult(path, page=page, cached=True))
+            entries[path] = entry
+        if pool is None:
+            return _resolved(build_file(page_cls, path))
+        return pool.submit(build_file, page_cls, path)
+
+    serial = workers == 1 or len(paths) <= 1
+    limit = 1 if serial else workers * chunk
+    with nullcontext() if serial else ProcessPoolExecutor(workers) as pool:
+        queue = iter(paths)
+        pending = [start(p) for _, p in zip(range(limit), queue)]
+        while pending:
+            if ordered:
+                done = [pending.pop(0)]
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done = [f for f in pending if f in finished]
+                pending = [f for f in pending if f not in finished]
+            for future in done:
+                result: BuildResult = future.result()
+                if result.issues:
+                    (collector or default_collector).absorb(result.issues)
+                if (
+                    manifest
+                    and result.ok
+                    and (e := entries.pop(result.path, None))
+                ):
+                    manifest.store(result.path, e, result.page)  # type: ignore
+                yield result
+                if (path := next(queue, None)) is not None:
+                    pending.append(start(path))
+
+    if manifest:
+        manifest.save()
+
+
+def _resolved(result: BuildResult) -> Future:
+    future: Future = Future()
+    future.set_result(result)
+    return future
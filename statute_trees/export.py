@@ -0,0 +1,251 @@
+import datetime
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+from .nodes_codification import CodePage
+from .nodes_document import DocPage
+from .nodes_statute import StatutePage
+from .resources import Page
+
+SQL_TYPES: dict[Any, str] = {
+    str: "TEXT",
+    int: "INTEGER",
+    float: "REAL",
+    datetime.date: "TEXT",  # isoformat
+}
+"""SQLite type of each python type found in the `col` of a `Field`."""
+
+TABLES: dict[type[Page], tuple[str, str]] = {
+    StatutePage: ("statutes", "statute_id"),
+    CodePage: ("codifications", "codification_id"),
+    DocPage: ("documents", "document_id"),
+}
+"""Table of each page class and the foreign key of its units, matching the
+key used by the `searchables()` of the unit class."""
+
+BULK_PRAGMAS = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": "-262144",  # in KiB, i.e. 256 MiB
+    "locking_mode": "EXCLUSIVE",
+}
+"""Applied to the connection for the duration of `export_pages()`; these
+trade durability for speed, so the exported database should be rebuilt
+rather than relied upon if the process is interrupted."""
+
+RESTORED_PRAGMAS = {
+    "journal_mode": "DELETE",
+    "synchronous": "FULL",
+    "locking_mode": "NORMAL",
+}
+
+
+class Column(NamedTuple):
+    """A column derived from the `col`, `index` and `fts` extras of a field.
+    Columns marked `fts` are searched through their full text index so no
+    separate b-tree index is created for them, e.g. a unit's `content`."""
+
+    name: str
+    type: str
+    index: bool = False
+    fts: bool = False
+
+
+def columns(
+    model: type[BaseModel], rename: dict[str, str] | None = None
+) -> list[Column]:
+    """Columns of the fields of the `model` with a `col`, in field order;
+    the `rename` maps a field name to its column name, e.g. the `id` of a
+    unit is stored as its `material_path`."""
+    cols = []
+    for name, field in model.__fields__.items():
+        extra = field.field_info.extra
+        if (col := extra.get("col")) is None:
+            continue
+        cols.append(
+            Column(
+                name=(rename or {}).get(name, name),
+                type=SQL_TYPES.get(col, "TEXT"),
+                index=bool(extra.get("index")),
+                fts=bool(extra.get("fts")),
+            )
+        )
+    return cols
+
+
+class TableSpec(NamedTuple):
+    """DDL of a table whose rows are bulk loaded before any of its indexes
+    (including the `unique` key) and its full text index are created."""
+
+    name: str
+    columns: list[Column]
+    unique: tuple[str, ...]
+
+    @property
+    def create(self) -> str:
+        cols = ", ".join(f"{c.name} {c.type}" for c in self.columns)
+        return f"CREATE TABLE IF NOT EXISTS {self.name} ({cols})"
+
+    @property
+    def insert(self) -> str:
+        names = ", ".join(c.name for c in self.columns)
+        marks = ", ".join("?" for _ in self.columns)
+        return f"INSERT INTO {self.name} ({names}) VALUES ({marks})"
+
+    @property
+    def indexes(self) -> list[str]:
+        key = ", ".join(self.unique)
+        stmts = [
+            f"CREATE UNIQUE INDEX IF NOT EXISTS idx_{self.name}_key ON"
+            f" {self.name} ({key})"
+        ]
+        for c in self.columns:
+            if c.index and not c.fts and (c.name,) != self.unique:
+                stmts.append(
+                    f"CREATE INDEX IF NOT EXISTS idx_{self.name}_{c.name} ON"
+                    f" {self.name} ({c.name})"
+                )
+        return stmts
+
+    @property
+    def fts(self) -> list[str]:
+        """External content FTS5 table, populated in one pass from the
+        table itself via the `rebuild` command."""
+        if not (names := [c.name for c in self.columns if c.fts]):
+            return []
+        fts = f"{self.name}_fts"
+        return [
+            (
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING"
+                f" fts5({', '.join(names)},"
+                f" content='{self.name}', content_rowid='rowid')"
+            ),
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ]
+
+    def drop(self) -> list[str]:
+        return [
+            f"DROP TABLE IF EXISTS {self.name}_fts",
+            f"DROP TABLE IF EXISTS {self.name}",
+        ]
+
+
+def page_spec(page_cls: type[Page]) -> TableSpec:
+    table, _ = TABLES[page_cls]
+    return TableSpec(table, columns(page_cls), ("id",))
+
+
+def unit_spec(page_cls: type[Page]) -> TableSpec:
+    """Each unit of the tree becomes a row keyed by its page and the sort key
+    of its material path, so that the unique index of the key serves both
+    the units of a page in pre-order and each subtree as a range scan (see
+    `utils.subtree_range()`); see `TreeishNode.searchables()` for the name
+    of the foreign key."""
+    table, fk = TABLES[page_cls]
+    unit_cls = page_cls.__fields__["tree"].type_
+    cols = columns(unit_cls, rename={"id": "material_path"})
+    return TableSpec(
+        f"{table[:-1]}_units",
+        [Column(fk, "TEXT"), *cols, Column("sort_key", "TEXT")],
+        (fk, "sort_key"),
+    )
+
+
+def _value(v: Any) -> Any:
+    return v.isoformat() if isinstance(v, datetime.date) else v
+
+
+def page_row(page: Page, spec: TableSpec) -> tuple:
+    return tuple(_value(getattr(page, c.name)) for c in spec.columns)
+
+
+def unit_rows(page: Page, spec: TableSpec) -> Iterator[tuple]:
+    """Rows of every unit in the `tree` of the `page` in pre-order; the first
+    column is the page's `id`, the rest are fields of the unit, see
+    `TreeishNode.rows()`."""
+    fields = [c.name for c in spec.columns[1:]]
+    names = ["id" if f == "material_path" else f for f in fields]
+    unit_cls = page.__fields__["tree"].type_
+    return unit_cls.rows(page.id, page.tree or [], tuple(names))
+
+
+class ExportReport(NamedTuple):
+    pages: int
+    units: int
+
+
+def export_pages(
+    db: Path | str,
+    page_cls: type[Page],
+    pages: Iterable[Page],
+    batch: int = 10000,
+    replace: bool = True,
+) -> ExportReport:
+    """Bulk load the `pages`, e.g. the pages of `build_corpus()`, and all
+    their units into the SQLite database `db`.
+
+    The tables, indexes and full text search (FTS5) tables are derived from
+    the `col`, `index` and `fts` extras of the fields of the `page_cls` and
+    of its unit class, see `page_spec()` and `unit_spec()`.
+
+    Rows are inserted with `executemany()` in batches, all within a single
+    transaction and under the `BULK_PRAGMAS`. The indexes and the full text
+    content are only created once all rows have been inserted since building
+    each in one pass is far cheaper than updating it on every insert.
+
+    Args:
+        db (Path | str): The SQLite database file
+        page_cls (type[Page]): One of `StatutePage`, `CodePage`, `DocPage`
+        pages (Iterable[Page]): Pages of the `page_cls`
+        batch (int, optional): Rows per `executemany()`. Defaults to 10000.
+        replace (bool, optional): Drop the tables if these already exist.
+            Defaults to True.
+
+    Returns:
+        ExportReport: The number of pages and units inserted
+    """
+    specs = page_spec(page_cls), unit_spec(page_cls)
+    buffers: tuple[list[tuple], list[tuple]] = ([], [])
+    counts = [0, 0]
+    conn = sqlite3.connect(db, isolation_level=None)
+
+    def flush(i: int):
+        conn.executemany(specs[i].insert, buffers[i])
+        counts[i] += len(buffers[i])
+        buffers[i].clear()
+
+    try:
+        for k, v in BULK_PRAGMAS.items():
+            conn.execute(f"PRAGMA {k} = {v}")
+        conn.execute("BEGIN")
+        for spec in specs:
+            for stmt in spec.drop() if replace else []:
+                conn.execute(stmt)
+            conn.execute(spec.create)
+        for page in pages:
+            buffers[0].append(page_row(page, specs[0]))
+            for row in unit_rows(page, specs[1]):
+                buffers[1].append(row)
+                if len(buffers[1]) >= batch:
+                    flush(1)
+            if len(buffers[0]) >= batch:
+                flush(0)
+        for i, spec in enumerate(specs):
+            flush(i)
+            for stmt in spec.indexes + spec.fts:
+                conn.execute(stmt)
+        conn.execute("COMMIT")
+        for k, v in RESTORED_PRAGMAS.items():
+            conn.execute(f"PRAGMA {k} = {v}")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+    return ExportReport(*counts)
@@ -0,0 +1,187 @@
+import json
+import re
+from bisect import bisect_left
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import NamedTuple
+
+from .resources import Page, normalize_sec
+from .utils import get_field, preorder, walk_keys
+
+SEPARATOR = ">"
+"""Separates the parts of a nested locator, e.g. "Article 2 > Paragraph 1"."""
+
+PUNCTUATION = re.compile(r"[^\w\s]+")
+SPACES = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2**16)
+def fold_label(item: str) -> str:
+    """Comparable form of an `item` label or of a locator: sections are
+    normalized by `normalize_sec()` before case and punctuation are folded,
+    e.g. "Sec. 18." and "SECTION 18" are both "section 18"."""
+    text = PUNCTUATION.sub(" ", normalize_sec(item)).casefold()
+    return SPACES.sub(" ", text).strip()
+
+
+class LabelIndex:
+    """Hash index of the folded `item` labels of a tree of units (models or
+    dicts) to their positions in pre-order, with the parent of each position
+    kept so that nested locators can be matched against the ancestors of
+    each candidate, see `find()`.
+
+    The index of a page is available as `Page.labels` and can be stored
+    alongside its `units` with `dumps()` / `loads()`.
+    """
+
+    __slots__ = ("ids", "labels", "parents", "pos", "_sorted")
+
+    def __init__(self, nodes: list | None = None):
+        self.ids: list[str] = []
+        self.labels: list[str] = []
+        self.parents: list[int] = []
+        self.pos: dict[str, list[int]] = {}
+        self._sorted: list[str] | None = None  # distinct labels, for prefixes
+        for idx, parent, node in preorder(nodes):
+            label = fold_label(get_field(node, "item") or "")
+            self.ids.append(get_field(node, "id"))
+            self.labels.append(label)
+            self.parents.append(parent)
+            self.pos.setdefault(label, []).append(idx)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def dumps(self) -> str:
+        """Json of the ids, labels and parents of the index, see `loads()`."""
+        data = [self.ids, self.labels, self.parents]
+        return json.dumps(data, separators=(",", ":"))
+
+    @classmethod
+    def loads(cls, text: str) -> "LabelIndex":
+        """Restore an index from its `dumps()` without walking the tree."""
+        index = cls()
+        index.ids, index.labels, index.parents = json.loads(text)
+        for idx, label in enumerate(index.labels):
+            index.pos.setdefault(label, []).append(idx)
+        return index
+
+    def starting_with(self, prefix: str) -> list[int]:
+        """Positions, in pre-order, of the units whose folded label starts
+        with the folded `prefix`, e.g. "Section 1" for "Section 1", "Section
+        10", "Section 11", etc. The distinct labels are only sorted on the
+        first such query so that building the index remains a single pass.
+        """
+        if self._sorted is None:
+            self._sorted = sorted(self.pos)
+        folded = fold_label(prefix)
+        start = bisect_left(self._sorted, folded)
+        end = bisect_left(self._sorted, folded + "\U0010ffff", lo=start)
+        return sorted(p for k in self._sorted[start:end] for p in self.pos[k])
+
+    def find(self, locator: str) -> list[str]:
+        """Material paths of the units labeled with the `locator`, e.g.
+        "Section 18", in pre-order; more than one unit may bear the same
+        label under different parents. A nested locator, e.g. "Article II >
+        Section 1", only matches a unit whose ancestors bear the outer
+        labels in the same order, though not necessarily as immediate
+        parents, e.g. with a "Container 1" in between. A trailing `*` on the
+        last part matches labels by prefix, e.g. "Article II > Section 1*".
+        """
+        *parts, last = locator.split(SEPARATOR)
+        outer = [fold_label(p) for p in parts]
+        if (last := last.strip()).endswith("*"):
+            candidates = self.starting_with(last[:-1])
+        else:
+            candidates = self.pos.get(fold_label(last), [])
+        found = []
+        for idx in candidates:
+            wanted, parent = len(outer), self.parents[idx]
+            while wanted and parent >= 0:
+                if self.labels[parent] == outer[wanted - 1]:
+                    wanted -= 1
+                parent = self.parents[parent]
+            if not wanted:
+                found.append(self.ids[idx])
+        return found
+
+
+class ResolvedEvent(NamedTuple):
+    """A `history` event of a codification unit and the material paths of
+    the units of the statute matching its locator, if any."""
+
+    codification_id: str
+    material_path: str
+    statute_category: str
+    statute_serial_id: str
+    locator: str
+    statute_paths: tuple[str, ...]
+
+
+class Resolution(NamedTuple):
+    resolved: list[ResolvedEvent]
+    unresolved: list[ResolvedEvent]
+
+
+class LocatorResolver:
+    """Label indexes of statute pages keyed by their category and serial id,
+    so that the `locator` of each `EventStatute` can be resolved to the
+    material paths of the statute's units without walking its tree. A
+    single variant is kept per statute: the last one added."""
+
+    __slots__ = ("indexes",)
+
+    def __init__(self):
+        self.indexes: dict[tuple[str, str], LabelIndex] = {}
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Page]) -> "LocatorResolver":
+        resolver = cls()
+        for page in pages:
+            resolver.add(page)
+        return resolver
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self.indexes
+
+    def add(self, page: Page):
+        """Index a `StatutePage` with its `Page.labels`."""
+        key = (page.statute_category, page.statute_serial_id)  # type: ignore
+        self.indexes[key] = page.labels
+
+    def resolve(
+        self, category: str, serial_id: str, locator: str
+    ) -> list[str]:
+        """Material paths of the statute's units matching the `locator`,
+        see `LabelIndex.find()`."""
+        if index := self.indexes.get((category.lower(), serial_id.lower())):
+            return index.find(locator)
+        return []
+
+    def resolve_events(self, pages: Iterable[Page]) -> Resolution:
+        """Resolve every statute event in the `history` of the units of the
+        codification `pages` in a single pass, with each distinct statute
+        and locator pair looked up only once. Events whose statute is not
+        indexed or whose locator matches no unit are `unresolved`; events
+        without a matched statute are skipped."""
+        found: dict[tuple[str, str, str], tuple[str, ...]] = {}
+        result = Resolution([], [])
+        for page in pages:
+            units = page.raw_units()
+            for hit in walk_keys(units, "history", child_key="units"):
+                for event in hit.value:
+                    cat = get_field(event, "statute_category")
+                    serial = get_field(event, "statute_serial_id")
+                    if not cat or not serial:
+                        continue
+                    loc = get_field(event, "locator") or ""
+                    if (key := (cat, serial, loc)) not in found:
+                        found[key] = tuple(self.resolve(*key))
+                    item = ResolvedEvent(
+                        page.id, hit.material_path, *key, found[key]
+                    )
+                    if found[key]:
+                        result.resolved.append(item)
+                    else:
+                        result.unresolved.append(item)
+        return result
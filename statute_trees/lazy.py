@@ -0,0 +1,26 @@
+import sys
+from collections.abc import Callable
+from importlib import import_module
+
+TYPE_CHECKING = False  # avoids importing typing, see the import-time test
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable, Callable]:
+    """The module-level `__getattr__` and `__dir__` of the `package`, which
+    import each of its `exports` (name to relative module) on first access
+    and keep it in the package's namespace thereafter."""
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str):
+        if module := exports.get(name):
+            value = getattr(import_module(module, package), name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> list[str]:
+        return sorted([*namespace, *exports])
+
+    return __getattr__, __dir__
@@ -0,0 +1,159 @@
+import sys
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from loguru import Logger
+
+DEFAULT_HANDLERS: list[dict] = [
+    {
+        "sink": sys.stdout,
+        "format": "{message}",
+        "level": "ERROR",
+        "enqueue": True,
+    },
+    {
+        "sink": "logs/tree_setup.log",
+        "format": "{message}",
+        "level": "ERROR",
+        "serialize": True,
+        "enqueue": True,
+    },
+]
+"""Used when the caller has not called `configure_logging()` by the time the
+first message is logged; note that the file sink creates a `logs` folder in
+the current working directory. Messages are `enqueue`d so that writing to the
+sinks happens in a background thread rather than in the build itself."""
+
+_configured = False
+
+
+def configure_logging(handlers: list[dict] | None = None) -> "Logger":
+    """Configure loguru's handlers for messages logged by this library, e.g.
+    bad codification events. Calling this before any build replaces the
+    `DEFAULT_HANDLERS`; pass an empty list to discard all messages."""
+    global _configured
+    from loguru import logger
+
+    logger.configure(
+        handlers=DEFAULT_HANDLERS if handlers is None else handlers
+    )
+    _configured = True
+    return logger
+
+
+def get_logger() -> "Logger":
+    """The loguru logger, configured with `DEFAULT_HANDLERS` on first use
+    unless `configure_logging()` was called beforehand."""
+    if not _configured:
+        return configure_logging()
+    from loguru import logger
+
+    return logger
+
+
+class ErrorReport(NamedTuple):
+    """Summary of the errors recorded by an `ErrorCollector`: counts by kind
+    and by source file, plus a capped sample of messages per source."""
+
+    total: int = 0
+    by_kind: dict[str, int] = {}
+    by_source: dict[str, int] = {}
+    samples: dict[str, list[str]] = {}
+
+    @property
+    def dropped(self) -> int:
+        """Messages counted but not kept in the `samples`."""
+        return self.total - sum(len(v) for v in self.samples.values())
+
+
+UNKNOWN = "<unknown>"
+"""Source of the errors recorded outside of `collecting()`, e.g. by a direct
+call to `CodePage.build()`; since these are not bounded by a file, each of
+them is logged rather than only the first `max_per_source`."""
+
+
+class ErrorCollector:
+    """Aggregated alternative to logging each error as it happens.
+
+    `record()` counts the error by kind and source and keeps at most
+    `max_per_source` messages per source; only the kept messages are logged
+    (when `log` is set), save for those of an `UNKNOWN` source, so a bad batch costs a counter increment per error
+    rather than a write. Since the `DEFAULT_HANDLERS` are `enqueue`d, even
+    the kept messages are written in loguru's background thread.
+    """
+
+    def __init__(self, max_per_source: int = 20, log: bool = True):
+        self.max_per_source = max_per_source
+        self.log = log
+        self.by_kind: Counter[str] = Counter()
+        self.by_source: Counter[str] = Counter()
+        self.samples: dict[str, list[str]] = {}
+
+    def record(self, kind: str, message: str, source: str | None = None):
+        src = source or current_source.get() or UNKNOWN
+        self.by_kind[kind] += 1
+        self.by_source[src] += 1
+        self._keep(src, [message])
+
+    def _keep(self, src: str, messages: list[str]):
+        sample = self.samples.setdefault(src, [])
+        kept = messages[: self.max_per_source - len(sample)]
+        sample.extend(kept)
+        if src == UNKNOWN:
+            kept = messages
+        if self.log and kept:
+            logger = get_logger()
+            for message in kept:
+                logger.error(f"{src}: {message}")
+
+    def absorb(self, report: ErrorReport):
+        """Merge the `report` of another collector, e.g. from a worker
+        process, logging the samples it keeps of the report's."""
+        self.by_kind.update(report.by_kind)
+        self.by_source.update(report.by_source)
+        for src, messages in report.samples.items():
+            self._keep(src, messages)
+
+    def report(self) -> ErrorReport:
+        return ErrorReport(
+            total=sum(self.by_kind.values()),
+            by_kind=dict(self.by_kind),
+            by_source=dict(self.by_source),
+            samples={k: list(v) for k, v in self.samples.items()},
+        )
+
+
+collector = ErrorCollector()
+"""Default collector for errors recorded outside of `collecting()`, and for
+the reports of a `corpus.build_corpus()` that is not given its own."""
+
+current_source: ContextVar[str | None] = ContextVar(
+    "current_source", default=None
+)
+active_collector: ContextVar[ErrorCollector] = ContextVar(
+    "active_collector", default=collector
+)
+
+
+def record_error(kind: str, message: str):
+    """Record an error, e.g. from a validator, in the active collector."""
+    active_collector.get().record(kind, message)
+
+
+@contextmanager
+def collecting(
+    source: str, target: ErrorCollector | None = None
+) -> Iterator[ErrorCollector]:
+    """Attribute errors recorded within the block to the `source` file and
+    collect them in the `target` (a fresh, non-logging collector if none)."""
+    target = target or ErrorCollector(log=False)
+    src, col = current_source.set(source), active_collector.set(target)
+    try:
+        yield target
+    finally:
+        current_source.reset(src)
+        active_collector.reset(col)
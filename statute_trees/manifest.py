@@ -0,0 +1,125 @@
+import hashlib
+import json
+import pickle
+from functools import cache
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from .resources import Page
+
+MANIFEST_FILE = "manifest.json"
+
+
+@cache
+def schema_fingerprint(page_cls: type[Page]) -> str:
+    """Any change in the library version or the fields / validators reflected
+    in the json schema of the `page_cls` invalidates previously built pages.
+    """
+    from . import __version__
+
+    schema = json.dumps(page_cls.schema(), default=repr, sort_keys=True)
+    text = f"{__version__}:{schema}"
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def source_files(page_cls: type[Page], path: Path) -> list[Path]:
+    """Files that contribute to the page built from `path`. A statute's
+    `details.yaml` pulls its units from sibling yaml files in the same folder
+    (see `statute_patterns.Rule.units_path`) so all of them are included."""
+    from .nodes_statute import StatutePage
+
+    if issubclass(page_cls, StatutePage):
+        return sorted(p for p in path.parent.glob("*.y*ml") if p.is_file())
+    return [path]
+
+
+def content_digest(page_cls: type[Page], path: Path) -> str:
+    h = hashlib.sha256()
+    for p in source_files(page_cls, path):
+        h.update(p.name.encode())
+        h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+def source_digest(path: Path) -> str:
+    return hashlib.sha256(str(path).encode()).hexdigest()
+
+
+class ManifestEntry(BaseModel):
+    digest: str = Field(..., description="Hash of the source file contents.")
+    fingerprint: str = Field(..., description="See `schema_fingerprint()`.")
+    source: str = Field("", description="Hash of the source path.")
+
+    @property
+    def output(self) -> str:
+        """Filename of the pickled page within the manifest folder. Pages
+        built from the same contents at different paths differ, e.g. in
+        their `created` and `modified`, so each path has its own output."""
+        name = f"{self.digest}-{self.source[:16]}-{self.fingerprint[:16]}"
+        return f"{self.digest[:2]}/{name}.pkl"
+
+
+class BuildManifest(BaseModel):
+    """Persistent record of previously built pages, keyed by source path.
+
+    A page is only rebuilt when either its source contents or the schema
+    fingerprint of its page class changed; otherwise the prior output
+    (pickled in the manifest `folder`) is reused as is.
+
+    Since the outputs are pickles, the `folder` should only ever contain
+    files that were written by a `BuildManifest`.
+    """
+
+    folder: Path
+    entries: dict[str, ManifestEntry] = {}
+
+    @classmethod
+    def load(cls, folder: Path) -> "BuildManifest":
+        if (target := folder / MANIFEST_FILE).exists():
+            return cls.parse_raw(target.read_text())
+        return cls(folder=folder)
+
+    def save(self) -> Path:
+        self.folder.mkdir(parents=True, exist_ok=True)
+        target = self.folder / MANIFEST_FILE
+        target.write_text(self.json(indent=1))
+        return target
+
+    def entry(self, page_cls: type[Page], path: Path) -> ManifestEntry:
+        """Entry that `path` would have if it were built now."""
+        return ManifestEntry(
+            digest=content_digest(page_cls, path),
+            fingerprint=schema_fingerprint(page_cls),
+            source=source_digest(path),
+        )
+
+    def fetch(self, path: Path, entry: ManifestEntry) -> Page | None:
+        """Prior output of `path` if it was built with the same `entry`."""
+        if self.entries.get(str(path)) != entry:
+            return None
+        try:
+            return pickle.loads((self.folder / entry.output).read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def store(self, path: Path, entry: ManifestEntry, page: Page):
+        prior = self.entries.get(str(path))
+        target = self.folder / entry.output
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(pickle.dumps(page, pickle.HIGHEST_PROTOCOL))
+        self.entries[str(path)] = entry
+        if prior and prior.output != entry.output:
+            self.release(prior.output)
+
+    def release(self, output: str):
+        """Delete the pickled `output` unless an entry still refers to it."""
+        if all(e.output != output for e in self.entries.values()):
+            (self.folder / output).unlink(missing_ok=True)
+
+    def prune(self):
+        """Forget the entries of source paths that no longer exist and delete
+        their outputs. Entries of other files, e.g. from another root or page
+        class sharing this manifest, are kept."""
+        for key in [k for k in self.entries if not Path(k).exists()]:
+            self.release(self.entries.pop(key).output)
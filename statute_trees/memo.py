@@ -0,0 +1,186 @@
+import datetime
+import re
+from collections.abc import Callable, Iterable
+from functools import lru_cache, update_wrapper
+from typing import NamedTuple
+
+from statute_patterns import Rule, extract_rule
+
+from .logs import get_logger
+from .utils import walk_keys
+
+
+class Memoized:
+    """A `functools.lru_cache` of the `func` whose `maxsize` can be changed
+    after import, see `configure_caches()`. Modules that imported the
+    memoized function keep calling the same object, so resizing replaces
+    its cache (emptying it) without rebinding their names."""
+
+    def __init__(self, func: Callable, maxsize: int | None):
+        update_wrapper(self, func)
+        self.func = func
+        self.resize(maxsize)
+
+    def __call__(self, *args):
+        return self.cached(*args)
+
+    @property
+    def maxsize(self) -> int | None:
+        return self.cached.cache_info().maxsize
+
+    def resize(self, maxsize: int | None):
+        self.cached = lru_cache(maxsize=maxsize)(self.func)
+
+    def cache_info(self):
+        return self.cached.cache_info()
+
+    def cache_clear(self):
+        self.cached.cache_clear()
+
+
+def memoized(maxsize: int | None) -> Callable[[Callable], Memoized]:
+    return lambda func: Memoized(func, maxsize)
+
+
+RULE_CACHE_SIZE = 4096
+"""Codifications cite the same few statutes (e.g. "Republic Act No. 386")
+thousands of times, so a modest bound suffices to catch nearly every repeat.
+The default `maxsize` of each cache can be changed via `configure_caches()`.
+"""
+
+
+@memoized(RULE_CACHE_SIZE)
+def cached_rule(text: str) -> Rule | None:
+    """Memoized `statute_patterns.extract_rule()`. The `Rule` returned is
+    shared between callers and must be treated as read-only.
+
+    `lru_cache` is thread-safe; each worker process of a pool keeps its own
+    cache so there is no shared state to guard across processes."""
+    return extract_rule(text)
+
+
+@memoized(RULE_CACHE_SIZE)
+def cached_serial_id(cat: str, id: str) -> str:
+    """Variants of the same rule have the same serial id, e.g.
+    rule_am/00-5-03-sc-1 and rule_am/00-5-03-sc-2 are both 00-5-03-sc."""
+    if cat == "rule_am" and re.search(r"^.*sc-\d+$", id):
+        return re.sub(r"-\d+$", "", id)
+    return id
+
+
+CITATION_CACHE_SIZE = 16384
+"""Distinct citations far outnumber distinct statutes but the same decisions
+(e.g. "220 Phil. 422") are still cited from many units and codifications."""
+
+
+@memoized(CITATION_CACHE_SIZE)
+def cached_citation(v: str) -> str | ValueError:
+    """Memoized normalization of a citation string via
+    `citation_utils.Citation.extract_citations()`: the docket, scra, phil or
+    offg of the only citation found; otherwise a `ValueError`."""
+    from citation_utils import Citation  # heavy, only needed for citations
+
+    if docs := list(Citation.extract_citations(v)):
+        if len(docs) == 1:
+            doc = docs[0]
+            return doc.docket or doc.scra or doc.phil or doc.offg
+        return ValueError(f"Too many citations found {docs=}")
+    return ValueError(f"No citations found {v=}")
+
+
+def collect_citations(data: dict) -> set[str]:
+    """Distinct citation strings found in the `history` and `sources` events
+    of a loaded codification / document yaml."""
+    found = set()
+    for hit in walk_keys(data, ("history", "sources")):
+        for event in hit.value:
+            if isinstance(event, dict) and (c := event.get("citation")):
+                found.add(c)
+    return found
+
+
+def resolve_citations(texts: Iterable[str]) -> dict[str, str | ValueError]:
+    """Resolve each distinct citation in `texts` once, e.g. the union of
+    `collect_citations()` across a corpus, warming the cache used by
+    `EventCitation`. Worker processes forked afterwards (the default on
+    linux) inherit the warmed cache.
+
+    Past the `maxsize` of the cache, the earliest citations are evicted by
+    the later ones; a warning suggests `configure_caches()` in that case."""
+    distinct = set(texts)
+    if (size := cached_citation.maxsize) is not None and len(distinct) > size:
+        get_logger().warning(
+            f"{len(distinct)} citations exceed the cache of {size}; see"
+            " configure_caches()"
+        )
+    return {text: cached_citation(text) for text in distinct}
+
+
+DATE_CACHE_SIZE = 8192
+DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y", "%b. %d, %Y", "%d %B %Y")
+"""Common formats in the yaml files, e.g. October 15, 1986, tried via
+`strptime()` before falling back to the far slower `dateutil` parser."""
+
+
+@memoized(DATE_CACHE_SIZE)
+def cached_date(v: str | datetime.date) -> datetime.date:
+    """Memoized conversion of a date string into a `datetime.date`: ISO dates
+    are handled first, then the `DATE_FORMATS`, and finally anything else
+    that `dateutil.parser.parse()` understands; its errors are raised as is.
+    """
+    if isinstance(v, datetime.datetime):
+        return v.date()
+    if isinstance(v, datetime.date):
+        return v  # yaml loads unquoted ISO dates as dates
+    text = v.strip()
+    try:
+        return datetime.date.fromisoformat(text)
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    from dateutil.parser import parse  # only needed for the fallback
+
+    return parse(text).date()
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """Hit and miss counters of each memoized function in this process."""
+    return {
+        "rule": CacheStats(*cached_rule.cache_info()),
+        "serial_id": CacheStats(*cached_serial_id.cache_info()),
+        "citation": CacheStats(*cached_citation.cache_info()),
+        "date": CacheStats(*cached_date.cache_info()),
+    }
+
+
+def configure_caches(
+    rule: int | None = RULE_CACHE_SIZE,
+    citation: int | None = CITATION_CACHE_SIZE,
+    date: int | None = DATE_CACHE_SIZE,
+):
+    """Set the `maxsize` of each cache, `None` being unbounded, e.g. before a
+    `resolve_citations()` of a corpus with more distinct citations than the
+    default. The caches are emptied; worker processes forked afterwards
+    inherit the new sizes."""
+    cached_rule.resize(rule)
+    cached_serial_id.resize(rule)
+    cached_citation.resize(citation)
+    cached_date.resize(date)
+
+
+def cache_clear():
+    cached_rule.cache_clear()
+    cached_serial_id.cache_clear()
+    cached_citation.cache_clear()
+    cached_date.cache_clear()
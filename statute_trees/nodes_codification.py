@@ -1,12 +1,9 @@
-import json
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-import yaml
-from dateutil.parser import parse
 from pydantic import Field
-from statute_patterns import extract_rule
 
+from .memo import cached_date, cached_rule
 from .resources import (
     CitationAffector,
     Identifier,
@@ -17,6 +14,10 @@ from .resources import (
     TreeishNode,
     generic_mp,
 )
+from .utils import build_branches, load_page
+
+EVENT_KEYS = ("units", "history")
+"""Keys of a raw unit that are passed separately to the `CodeUnit`."""
 
 
 class CodeUnit(Node, TreeishNode):
@@ -51,20 +52,31 @@ class CodeUnit(Node, TreeishNode):
 
     @classmethod
     def create_branches(
-        cls, units: list[dict], parent_id: str = "1."
+        cls, units: Iterable[dict], parent_id: str = "1.", mutate: bool = True
     ) -> Iterator["CodeUnit"]:
-        for counter, u in enumerate(units, start=1):
-            children = []  # default unit being evaluated
-            id = f"{parent_id}{str(counter)}."
-            history = u.pop("history", None)
-            if subunits := u.pop("units", None):  # potential children
-                children = list(cls.create_branches(subunits, id))  # recursive
-            yield CodeUnit(
-                **u,
-                id=id,
-                history=history,
-                units=children,
-            )
+        def make(u: dict, id: str, children: list) -> CodeUnit:
+            if mutate:
+                u.pop("units", None)
+                history = u.pop("history", None)
+            else:
+                history = u.get("history")
+                u = {k: v for k, v in u.items() if k not in EVENT_KEYS}
+            return CodeUnit(**u, id=id, history=history, units=children)
+
+        yield from build_branches(units, make, parent_id)
+
+    @classmethod
+    def construct_events(cls, data: dict) -> dict:
+        if history := data.get("history"):
+            data["history"] = [
+                (
+                    CitationAffector.construct(**e)
+                    if "citation" in e
+                    else StatuteAffector.construct(**e)
+                )
+                for e in history
+            ]
+        return data
 
     @classmethod
     def searchables(cls, pk: str, units: list["CodeUnit"]):
@@ -73,40 +85,47 @@ class CodeUnit(Node, TreeishNode):
                 if u.content:
                     yield dict(
                         material_path=u.id,
+                        sort_key=u.sort_key,
                         codification_id=pk,
                         unit_text=f"{u.caption}. {u.content}",
                     )
                 else:
                     yield dict(
                         material_path=u.id,
+                        sort_key=u.sort_key,
                         codification_id=pk,
                         unit_text=u.caption,
                     )
             elif u.content:
                 yield dict(
-                    material_path=u.id, codification_id=pk, unit_text=u.content
+                    material_path=u.id,
+                    sort_key=u.sort_key,
+                    codification_id=pk,
+                    unit_text=u.content,
                 )
             if u.units:
                 yield from cls.searchables(pk, u.units)
 
 
 class CodePage(Page, StatuteBase):
-    tree: list[CodeUnit]
+    tree: list[CodeUnit] | None = Field(None)
 
     @classmethod
-    def build(cls, file_path: Path):
-        data = yaml.safe_load(file_path.read_text())
+    def build(cls, file_path: Path, stream: bool = False):
+        """Build the page from the yaml file; when `stream` is set, the units
+        of the file are loaded one at a time (see `utils.load_page()`)."""
+        data, units = load_page(file_path, stream)
         title = data.get("title")
         emails = data.get("emails", ["bot@lawsql.com"])
         variant = data.get("variant", 1)
-        date = parse(data.get("date")).date()
-        rule = extract_rule(data.get("base"))
+        date = cached_date(data.get("date"))
+        rule = cached_rule(data.get("base"))
         if not rule:
             return None
         tree = CodeUnit(
             id="1.",
             item=title,
-            units=list(CodeUnit.create_branches(data.get("units"))),
+            units=list(CodeUnit.create_branches(units)),
             history=None,
         )
         return cls(
@@ -124,6 +143,5 @@ class CodePage(Page, StatuteBase):
             date=date,
             variant=variant,
             tree=[tree],
-            units=json.dumps([tree.dict(exclude_none=True)]),
             **StatuteBase.from_rule(rule).dict(),
         )
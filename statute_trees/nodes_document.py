@@ -1,12 +1,10 @@
-import json
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Union
+from typing import NamedTuple, Union
 
-import yaml
-from dateutil.parser import parse
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
+from .memo import cached_date
 from .resources import (
     EventCitation,
     EventStatute,
@@ -17,7 +15,10 @@ from .resources import (
     TreeishNode,
     generic_mp,
 )
-from .utils import Layers
+from .utils import Layers, build_branches, dump_units, load_page
+
+EVENT_KEYS = ("units", "sources")
+"""Keys of a raw unit that are passed separately to the `DocUnit`."""
 
 
 class DocUnit(Node, TreeishNode):
@@ -33,74 +34,202 @@ class DocUnit(Node, TreeishNode):
 
     @classmethod
     def create_branches(
-        cls, units: list[dict], parent_id: str = "1."
+        cls, units: Iterable[dict], parent_id: str = "1.", mutate: bool = True
     ) -> Iterator["DocUnit"]:
-        if parent_id == "1.":
-            Layers.DEFAULT.layerize(units)  # in place
-        for counter, u in enumerate(units, start=1):
-            children = []  # default unit being evaluated
-            id = f"{parent_id}{str(counter)}."
-            sources = u.pop("sources", None)
-            if subunits := u.pop("units", None):  # potential children
-                children = list(cls.create_branches(subunits, id))  # recursive
-            yield DocUnit(**u, id=id, sources=sources, units=children)
+        labels = None if mutate else {}  # see Layers.layerize()
+        if parent_id == "1." and isinstance(units, list):
+            Layers.DEFAULT.layerize(units, labels=labels)  # in place
+        elif parent_id == "1.":
+            units = Layers.DEFAULT.label_each(units, labels=labels)  # streamed
+
+        def make(u: dict, mp: str, children: list) -> DocUnit:
+            if labels is None:
+                u.pop("units", None)
+                sources = u.pop("sources", None)
+            else:
+                sources = u.get("sources")
+                label = labels.pop(id(u), None)
+                u = {k: v for k, v in u.items() if k not in EVENT_KEYS}
+                if label:
+                    u["item"] = label
+            return DocUnit(**u, id=mp, sources=sources, units=children)
+
+        yield from build_branches(units, make, parent_id)
+
+    @classmethod
+    def construct_events(cls, data: dict) -> dict:
+        if sources := data.get("sources"):
+            data["sources"] = [
+                (
+                    EventCitation.construct(**e)
+                    if "citation" in e
+                    else (
+                        FTSQuery.construct(**e)
+                        if "query" in e
+                        else EventStatute.construct(**e)
+                    )
+                )
+                for e in sources
+            ]
+        return data
+
+    @staticmethod
+    def unit_text(u: "DocUnit") -> str | None:
+        """The searchable text of the unit, if any."""
+        if u.caption and u.content:
+            return f"{u.caption}. {u.content}"
+        return u.caption or u.content
 
     @classmethod
     def searchables(cls, pk: str, units: list["DocUnit"]):
         for u in units:
-            if u.caption:
-                if u.content:
-                    yield dict(
-                        material_path=u.id,
-                        document_id=pk,
-                        unit_text=f"{u.caption}. {u.content}",
-                    )
-                else:
-                    yield dict(
-                        material_path=u.id,
-                        document_id=pk,
-                        unit_text=u.caption,
-                    )
-            elif u.content:
+            if text := cls.unit_text(u):
                 yield dict(
                     material_path=u.id,
+                    sort_key=u.sort_key,
                     document_id=pk,
-                    unit_text=u.content,
+                    unit_text=text,
                 )
             if u.units:
                 yield from cls.searchables(pk, u.units)
 
+    @classmethod
+    def fuse_branches(
+        cls, units: Iterable[dict], pk: str, mutate: bool = True
+    ) -> "FusedBranches":
+        """Single traversal of the raw `units` that does, for each unit, what
+        `Layers.layerize()`, `create_branches()` and `searchables()` would
+        otherwise do in separate passes over the entire tree: label the unit,
+        assign its material path, validate it and create its searchable row.
+
+        Units are visited in pre-order to label them and assign their paths;
+        each is then validated once all its children have been, with its row
+        filling the slot reserved on the visit so that the rows remain in the
+        order of `searchables()`. Since the children are already validated,
+        they are attached to their parent as is rather than validated (and
+        copied) again. See `create_branches()` for `mutate`.
+        """
+        rows: list[dict | None] = []
+        labels: dict[int, str] = {}  # by row slot, unless `mutate`
+
+        def make(u: dict, mp: str, slot: int, children: list) -> DocUnit:
+            if mutate:
+                u.pop("units", None)
+                sources = u.pop("sources", None)
+            else:
+                sources = u.get("sources")
+                u = {k: v for k, v in u.items() if k not in EVENT_KEYS}
+                if label := labels.pop(slot, None):
+                    u["item"] = label
+            node = cls(**u, id=mp, sources=sources, units=[])
+            node.__dict__["units"] = children
+            if text := cls.unit_text(node):
+                rows[slot] = dict(
+                    material_path=mp,
+                    sort_key=node.sort_key,
+                    document_id=pk,
+                    unit_text=text,
+                )
+            return node
+
+        nodes: list[DocUnit] = []
+        categories: dict[int, list] = {}  # labels of each layer level
+        # each frame: [remaining siblings, their parent's id, layer level,
+        # whether labels were added, made siblings, the parent unit awaiting
+        # its children, the slot of its row]
+        stack: list[list] = [
+            [enumerate(units), "1.", 1, False, nodes, None, 0]
+        ]
+        while stack:
+            frame = stack[-1]
+            siblings, prefix, level, _, made, parent, slot = frame
+            for idx, u in siblings:
+                rows.append(None)
+                if "item" not in u:
+                    if (category := categories.get(level)) is None:
+                        item_type = Layers.DEFAULT.get_item_type(level)
+                        category = categories[level] = item_type.value
+                    if mutate:
+                        u["item"] = f"§{category[idx]}"
+                    else:
+                        labels[len(rows) - 1] = f"§{category[idx]}"
+                    frame[3] = True
+                mp = f"{prefix}{idx + 1}."
+                if (subunits := u.get("units")) and isinstance(subunits, list):
+                    sublevel = level + 1 if frame[3] else level
+                    stack.append(
+                        [enumerate(subunits), mp, sublevel, False, [], u]
+                        + [len(rows) - 1]
+                    )
+                    break
+                made.append(make(u, mp, len(rows) - 1, []))
+            else:
+                stack.pop()
+                if parent is not None:
+                    stack[-1][4].append(make(parent, prefix, slot, made))
+        return FusedBranches(nodes, [r for r in rows if r])
+
+
+class FusedBranches(NamedTuple):
+    """Result of `DocUnit.fuse_branches()`."""
+
+    units: list[DocUnit]
+    rows: list[dict]  # see `DocUnit.searchables()`
+
 
 class DocPage(Page):
-    tree: list[DocUnit]
+    tree: list[DocUnit] | None = Field(None)
+    _rows: list[dict] | None = PrivateAttr(None)
 
     @classmethod
-    def build(cls, file_path: Path):
-        data = yaml.safe_load(file_path.read_text())
+    def build(cls, file_path: Path, stream: bool = False, fused: bool = False):
+        """Build the page from the yaml file; when `stream` is set, the units
+        of the file are loaded one at a time (see `utils.load_page()`).
+
+        When `fused` is set, the units are labeled, validated and made
+        searchable in a single traversal (see `DocUnit.fuse_branches()`) and
+        the `units` are serialized right away by the json encoder, so that
+        neither `units` nor `searchables()` need another pass later."""
+        data, units = load_page(file_path, stream)
         title = data.get("title")
         emails = data.get("emails", ["bot@lawsql.com"])
         variant = data.get("variant", 1)
-        date = parse(data.get("date")).date()
+        date = cached_date(data.get("date"))
+        pk = Identifier(
+            text=title,
+            date=date,
+            variant=variant,
+            emails=emails,
+        ).slug
+        fused_branches = DocUnit.fuse_branches(units, pk) if fused else None
         tree = DocUnit(
             id="1.",
             item=title,
-            units=list(DocUnit.create_branches(data.get("units"))),
+            units=(
+                fused_branches.units
+                if fused_branches
+                else list(DocUnit.create_branches(units))
+            ),
             sources=None,
         )
-        return cls(
+        page = cls(
             created=file_path.stat().st_ctime,
             modified=file_path.stat().st_mtime,
-            id=Identifier(
-                text=data["title"],
-                date=parse(data.get("date")).date(),
-                variant=data.get("variant", 1),
-                emails=data.get("emails", ["bot@lawsql.com"]),
-            ).slug,
+            id=pk,
             emails=emails,
             title=title,
             description=data.get("description"),
             date=date,
             variant=variant,
             tree=[tree],
-            units=json.dumps([tree.dict(exclude_none=True)]),
+            units=dump_units([tree]) if fused_branches else None,
         )
+        page._rows = fused_branches.rows if fused_branches else None
+        return page
+
+    def searchables(self) -> Iterator[dict]:
+        """Rows of `DocUnit.searchables()` for the tree of this page; a
+        `fused` build will have already created these."""
+        if self._rows is not None:
+            return iter(self._rows)
+        return DocUnit.searchables(self.id, self.tree or [])
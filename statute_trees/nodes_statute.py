@@ -1,11 +1,11 @@
-import json
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from pydantic import Field
 from statute_patterns import Rule, StatuteTitle, count_rules
 
 from .resources import Node, Page, StatuteBase, TreeishNode, generic_mp
+from .utils import build_branches
 
 
 class StatuteUnit(Node, TreeishNode):
@@ -27,15 +27,18 @@ class StatuteUnit(Node, TreeishNode):
     @classmethod
     def create_branches(
         cls,
-        units: list[dict],
+        units: Iterable[dict],
         parent_id: str = "1.",
+        mutate: bool = True,
     ) -> Iterator["StatuteUnit"]:
-        for counter, u in enumerate(units, start=1):
-            children = []  # default unit being evaluated
-            id = f"{parent_id}{str(counter)}."
-            if subunits := u.pop("units", None):  # potential children
-                children = list(cls.create_branches(subunits, id))  # recursive
-            yield StatuteUnit(**u, id=id, units=children)
+        def make(u: dict, id: str, children: list) -> StatuteUnit:
+            if mutate:
+                u.pop("units", None)
+            else:
+                u = {k: v for k, v in u.items() if k != "units"}
+            return StatuteUnit(**u, id=id, units=children)
+
+        yield from build_branches(units, make, parent_id)
 
     @classmethod
     def searchables(cls, pk: str, units: list["StatuteUnit"]):
@@ -44,16 +47,23 @@ class StatuteUnit(Node, TreeishNode):
                 if u.content:
                     yield dict(
                         material_path=u.id,
+                        sort_key=u.sort_key,
                         statute_id=pk,
                         unit_text=f"{u.caption}. {u.content}",
                     )
                 else:
                     yield dict(
-                        material_path=u.id, statute_id=pk, unit_text=u.caption
+                        material_path=u.id,
+                        sort_key=u.sort_key,
+                        statute_id=pk,
+                        unit_text=u.caption,
                     )
             elif u.content:
                 yield dict(
-                    material_path=u.id, statute_id=pk, unit_text=u.content
+                    material_path=u.id,
+                    sort_key=u.sort_key,
+                    statute_id=pk,
+                    unit_text=u.content,
                 )
             if u.units:
                 yield from cls.searchables(pk, u.units)
@@ -62,16 +72,26 @@ class StatuteUnit(Node, TreeishNode):
     def granularize(
         cls, pk: str, nodes: list["StatuteUnit"]
     ) -> Iterator[dict]:
-        """Recursive flattening of the tree structure so that each material path
+        """Flattening of the tree structure so that each material path
         (with its separate item, caption, and content) can become their own row.
+
+        Each row also contains the serialized `units` of its subtree. Each unit
+        is serialized only once, bottom-up, with its dict shared by the rows
+        of its ancestors, rather than serializing every subtree anew per row;
+        see `rows()` when only the fields of each unit are needed.
         """
-        for i in nodes:
-            data = i.dict()
+        units = list(cls.walk(nodes))
+        dumped: dict[int, dict] = {}
+        for unit in reversed(units):  # children before their parents
+            data = unit.dict(exclude={"units"})
+            data["units"] = unit.units and [dumped[id(u)] for u in unit.units]
+            dumped[id(unit)] = data
+        for unit in units:
+            data = dict(dumped[id(unit)])
             data["statute_id"] = pk
             data["material_path"] = data.pop("id")
-            yield dict(**data)
-            if i.units:
-                yield from cls.granularize(pk, i.units)
+            data["sort_key"] = unit.sort_key
+            yield data
 
 
 class MentionedStatute(StatuteBase):
@@ -91,7 +111,7 @@ class MentionedStatute(StatuteBase):
 
 class StatutePage(Page, StatuteBase):
     titles: list[StatuteTitle]
-    tree: list[StatuteUnit]
+    tree: list[StatuteUnit] | None = Field(None)
 
     def join_elements(self, separator: str) -> str | None:
         if not self.variant:
@@ -149,5 +169,4 @@ class StatutePage(Page, StatuteBase):
             **details.dict(exclude={"units", "rule"}),
             **base.dict(),
             tree=[tree],
-            units=json.dumps([tree.dict(exclude_none=True)]),
         )
@@ -1,33 +1,32 @@
 import datetime
+import json
+import random
 import re
-import sys
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from enum import Enum
-
-from citation_utils import Citation
-from dateutil.parser import parse
-from loguru import logger
-from pydantic import BaseModel, EmailStr, Field, root_validator, validator
-from slugify import slugify
-from statute_patterns import Rule, extract_rule
+from operator import attrgetter
+from typing import Any, Literal
+
+from pydantic import (
+    BaseModel,
+    EmailStr,
+    Field,
+    PrivateAttr,
+    root_validator,
+    validator,
+)
+from statute_patterns import Rule
 from statute_patterns.components import StatuteSerialCategory
 
-logger.configure(
-    handlers=[
-        {
-            "sink": sys.stdout,
-            "format": "{message}",
-            "level": "ERROR",
-        },
-        {
-            "sink": "logs/tree_setup.log",
-            "format": "{message}",
-            "level": "ERROR",
-            "serialize": True,
-        },
-    ]
+from .logs import record_error
+from .memo import (
+    cached_citation,
+    cached_date,
+    cached_rule,
+    cached_serial_id,
 )
+from .utils import build_branches, dump_units, preorder, to_sort_key
 
 """
 Note: The fields are marked with col and index for future use by the sqlpyd library.
@@ -161,6 +160,8 @@ class Identifier(BaseModel):
         """Extracts the first name of the email address, adds
         the year from the date and joins the details to forms a
         single slug."""
+        from slugify import slugify
+
         authors = "-".join(email.split("@")[0] for email in self.emails)
         elements = [authors, self.date.year, self.text, f"v{self.variant}"]
         joined_text = "-".join(str(e) for e in elements)
@@ -171,7 +172,11 @@ class Identifier(BaseModel):
 class Page(BaseModel):
     """HTML pages will require a `title` and a `description`.
     Contains the following common fields for use in tree-like structures:
-    `created`, `modified`, `id`, `variant`, `units`."""
+    `created`, `modified`, `id`, `variant`, `units`.
+
+    The `units` json string and the `tree` of unit models (declared by
+    subclasses) are interchangeable: only one of them needs to be supplied and
+    the other is derived on first access, see `Derived`."""
 
     created: float = Field(col=float)
     modified: float = Field(col=float)
@@ -200,6 +205,140 @@ class Page(BaseModel):
         ),
         col=str,
     )
+    _labels: Any = PrivateAttr(None)
+
+    @root_validator(skip_on_failure=True)
+    def units_or_tree(cls, values):
+        if "tree" in cls.__fields__ and not values.get("tree"):
+            if not values.get("units"):
+                raise ValueError("Either the units or the tree is required.")
+        return values
+
+    def derive_units(self) -> str | None:
+        """The `units` json string serialized from the `tree`, if any."""
+        if tree := self.__dict__.get("tree"):
+            return dump_units(tree)
+        return None
+
+    def derive_tree(
+        self, trusted: bool = True, sample: float = 0.0
+    ) -> list | None:
+        """The `tree` of unit models rehydrated from the `units` json string,
+        if any. Since `units` are serialized from an already validated tree,
+        these are `trusted` by default, see `TreeishNode.load_branches()`."""
+        if (units := self.__dict__.get("units")) and "tree" in self.__fields__:
+            unit_cls = self.__fields__["tree"].type_
+            return unit_cls.load_branches(units, trusted, sample)
+        return None
+
+    def raw_units(self) -> list:
+        """The `tree` models if already available, otherwise the dicts parsed
+        from the `units` json, without deriving the one from the other; for
+        single passes over the units that accept either, see `drop()`."""
+        if tree := self.__dict__.get("tree"):
+            return tree
+        return json.loads(self.units or "[]")
+
+    @property
+    def labels(self):
+        """The `LabelIndex` of the `item` labels of the units, e.g. to find
+        "Section 18" or all of "Section 1*" without walking the tree. It is
+        made on first access from whichever of the `tree` or `units` is
+        available, in a single pass, and kept with the page (including its
+        pickle); `labels.dumps()` can be stored alongside the `units`."""
+        if self._labels is None:
+            from .labels import LabelIndex
+
+            self._labels = LabelIndex(self.raw_units())
+        return self._labels
+
+    def drop(self, name: Literal["units", "tree"]):
+        """Release the `units` string or the `tree` models to save memory; it
+        will be derived from the other again if accessed later."""
+        other = "tree" if name == "units" else "units"
+        if self.__dict__.get(other) is None:
+            raise ValueError(f"Cannot drop {name}, {other} is not available.")
+        self.__dict__[name] = None
+
+    def _materialize(self, include=None, exclude=None):
+        for name in ("units", "tree"):
+            if name not in self.__fields__:
+                continue
+            if include is not None and name not in include:
+                continue
+            if exclude is not None and exclude.get(name) is True:
+                continue
+            getattr(self, name)
+
+    def copy(self, **kwargs):
+        """Unless the update leaves both the `units` and the `tree` as they
+        were, whatever was derived from the prior ones is reset: the other of
+        the two, if not also updated, and every private attribute, e.g. the
+        `labels` or the searchable rows of a fused `DocPage`."""
+        page = super().copy(**kwargs)
+        if updated := {"units", "tree"} & set(kwargs.get("update") or {}):
+            for name in {"units", "tree"} - updated:
+                page.__dict__[name] = None  # derived again from the update
+            for name, attr in self.__private_attributes__.items():
+                object.__setattr__(page, name, attr.get_default())
+        return page
+
+    def dict(self, **kwargs):
+        self._materialize(kwargs.get("include"), _excluded(kwargs))
+        return super().dict(**kwargs)
+
+    def __iter__(self):
+        """Like `dict()`, `dict(page)` includes the derived field."""
+        self._materialize()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self._materialize()
+        return super().__repr_args__()
+
+    def json(self, **kwargs):
+        self._materialize(kwargs.get("include"), _excluded(kwargs))
+        return super().json(**kwargs)
+
+
+def _excluded(kwargs: dict) -> dict | None:
+    if (exclude := kwargs.get("exclude")) is None:
+        return None
+    if isinstance(exclude, dict):
+        return exclude
+    return {k: True for k in exclude}
+
+
+class Derived:
+    """Data descriptor for a `Page` field, i.e. `units` and `tree`, whose value
+    is computed from the other on first access and cached in the instance.
+
+    Since pydantic stores field values in the instance `__dict__`, a data
+    descriptor on the class takes precedence and can fill in a missing value
+    before it is read. This lets `build()` skip serializing the tree (for
+    callers that never read `units`) and lets pages loaded with only `units`
+    skip validating the tree (for callers that never read `tree`).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, page: Page | None, owner=None):
+        if page is None:
+            return None  # see pydantic.utils.validate_field_name
+        value = page.__dict__.get(self.name)
+        if value is None:
+            if (value := getattr(page, f"derive_{self.name}")()) is not None:
+                page.__dict__[self.name] = value
+                page.__fields_set__.add(self.name)  # see `exclude_unset`
+        return value
+
+    def __set__(self, page: Page, value):
+        page.__dict__[self.name] = value
+
+
+Page.units = Derived("units")  # type: ignore
+Page.tree = Derived("tree")  # type: ignore
 
 
 class Node(BaseModel):
@@ -273,10 +412,7 @@ class StatuteBase(BaseModel):
         """A rule is generated from a Path. Since there are some paths
         that do not map to rules because of variants, need to apply a
         special filter in extracting the proper `statute_serial_id`."""
-        target_id = r.id
-        if r.cat == "rule_am" and re.search(r"^.*sc-\d+$", r.id):
-            # handle cases like rule_am/00-5-03-sc-1 and rule_am/00-5-03-sc-2
-            target_id = re.sub(r"-\d+$", "", r.id)
+        target_id = cached_serial_id(r.cat, r.id)
         return cls(statute_category=r.cat, statute_serial_id=target_id)
 
 
@@ -320,14 +456,12 @@ class EventStatute(StatuteBase):
     @root_validator(pre=True)
     def split_statute(cls, values):
         if stat := values.get("statute"):
-            if rule := extract_rule(stat):
+            if rule := cached_rule(stat):
                 values["statute_category"] = rule.cat
                 values["statute_serial_id"] = rule.id
             else:
-                logger.error(f"Bad codification event; see {values=}")
-        else:
-            logger.error(f"Bad codification event; no statute in {values=}")
-        return values
+                record_error("unmatched_statute", f"No rule from {stat=}")
+        return values  # a missing statute fails as a required field
 
     @validator("date", pre=True)
     def date_in_isoformat(cls, v):
@@ -335,7 +469,7 @@ class EventStatute(StatuteBase):
             return None
         try:
             if isinstance(v, str):
-                return str(parse(v).date())
+                return str(cached_date(v))
         except Exception as e:
             return ValueError(f"Bad date {v=}; {e=}")
         return v
@@ -414,12 +548,7 @@ class EventCitation(BaseModel):
 
     @validator("citation")
     def citation_must_be_uniform(cls, v):
-        if docs := list(Citation.extract_citations(v)):
-            if len(docs) == 1:
-                doc = docs[0]
-                return doc.docket or doc.scra or doc.phil or doc.offg
-            return ValueError(f"Too many citations found {docs=}")
-        return ValueError(f"No citations found {v=}")
+        return cached_citation(v)
 
 
 class CitationAffector(EventCitation):
@@ -503,10 +632,17 @@ class TreeishNode(ABC):
 
     @classmethod
     @abstractmethod
-    def create_branches(cls, units: list[dict], parent_id: str = "1."):
+    def create_branches(
+        cls, units: Iterable[dict], parent_id: str = "1.", mutate: bool = True
+    ):
         """Each material path tree begins will eventually start with a root
         of `1.` so that each branch will be a material path (identified by
-        the `id`) to the root."""
+        the `id`) to the root.
+
+        By default, the `units` are consumed in place: children and events
+        are popped out of each dict (and labels added to documents). With
+        `mutate` set to False, the `units` are only read so that the caller
+        can reuse them without first making a deep copy."""
         raise NotImplementedError(
             "Tree-based nodes must have a create_branches() function; note"
             " that each branching function for each tree category is"
@@ -525,3 +661,116 @@ class TreeishNode(ABC):
             " columns that is searchable and whose snippet (see sqlite's"
             " snippet() function) can be highlighted."
         )
+
+    @classmethod
+    def construct_events(cls, data: dict) -> dict:
+        """Convert the event dicts of a trusted unit, e.g. `history` and
+        `sources`, into their models without validation; units without
+        events are returned as is."""
+        return data
+
+    @classmethod
+    def construct_branches(
+        cls, units: Iterable[dict], sample: float = 0.0
+    ) -> Iterator:
+        """Trusted counterpart of `create_branches()` for units that have
+        already been validated and assigned their material paths, e.g. the
+        `units` json string of a `Page`. Models are created via pydantic's
+        `construct()`, skipping validators such as the `id` regex,
+        `normalize_sec()` and whitespace stripping.
+
+        A `sample` ratio (from 0 to 1) of the units is nonetheless validated:
+        each sampled unit, sans children, must be valid and must already be
+        in its normalized form, otherwise a `ValueError` is raised.
+        """
+
+        def make(u: dict, id: str, children: list):
+            data = cls.construct_events(dict(u))
+            if children:
+                data["units"] = children
+            if sample and random.random() < sample:
+                cls.verify(u)
+            return cls.construct(**data)  # type: ignore
+
+        yield from build_branches(units, make)
+
+    @classmethod
+    def verify(cls, unit: dict):
+        """Validate the `unit` dict, sans children, and ensure that validation
+        would not have altered it."""
+        node = {k: v for k, v in unit.items() if k != "units"}
+        validated = cls(**node)  # type: ignore
+        if validated.dict(exclude_none=True, exclude={"units"}) != node:
+            raise ValueError(f"Unit {node.get('id')} is not in trusted form.")
+
+    @classmethod
+    def load_branches(
+        cls, units: str, trusted: bool = True, sample: float = 0.0
+    ) -> list:
+        """Rehydrate the `units` json string of a `Page` into unit models,
+        see `construct_branches()` for the `trusted` mode and its `sample`
+        of validated units; otherwise each unit is fully validated."""
+        nodes = json.loads(units)
+        if trusted:
+            return list(cls.construct_branches(nodes, sample))
+        return [cls.parse_obj(node) for node in nodes]  # type: ignore
+
+    @property
+    def sort_key(self) -> str:
+        """Order-preserving key of the material path `id`, see
+        `utils.to_sort_key()`; unlike the `id`, sorting by this key keeps the
+        units in pre-order, e.g. "1.2." before "1.10."."""
+        return to_sort_key(self.id)  # type: ignore
+
+    @classmethod
+    def walk(cls, units: Iterable) -> Iterator:
+        """Each of the `units` and their descendants in pre-order, i.e. the
+        order of `searchables()`, see `utils.preorder()`."""
+        return (unit for _, _, unit in preorder(units))
+
+    @classmethod
+    def rows(
+        cls,
+        pk: str,
+        units: Iterable,
+        fields: tuple[str, ...] = ("id", "item", "caption", "content"),
+    ) -> Iterator[tuple]:
+        """Fixed-shape rows of the `units` in pre-order: the `pk` of the
+        container followed by the `fields` of each unit, read as is from the
+        model. Unlike `searchables()`, no dict or joined `unit_text` is made
+        per unit; unlike `StatuteUnit.granularize()`, no unit is serialized.
+
+        Args:
+            pk (str): The foreign key of the container, e.g. the page `id`
+            units (Iterable): Unit models, e.g. the `tree` of a page
+            fields (tuple[str, ...], optional): Attributes of each unit.
+                Defaults to ("id", "item", "caption", "content").
+
+        Yields:
+            Iterator[tuple]: `(pk, *fields)` of each unit
+        """
+        getters = [attrgetter(f) for f in fields]
+        for unit in cls.walk(units):
+            yield (pk, *(get(unit) for get in getters))
+
+    @classmethod
+    def row_batches(
+        cls,
+        pk: str,
+        units: Iterable,
+        fields: tuple[str, ...] = ("id", "item", "caption", "content"),
+        size: int = 1000,
+        columnar: bool = False,
+    ) -> Iterator[list[tuple] | tuple[tuple, ...]]:
+        """The `rows()` grouped into batches of at most `size` rows, e.g. for
+        `executemany()`; when `columnar`, each batch is instead a tuple of
+        columns, the first being the `pk` repeated and the rest aligned with
+        the `fields`."""
+        batch: list[tuple] = []
+        for row in cls.rows(pk, units, fields):
+            batch.append(row)
+            if len(batch) == size:
+                yield tuple(zip(*batch)) if columnar else batch
+                batch = []
+        if batch:
+            yield tuple(zip(*batch)) if columnar else batch
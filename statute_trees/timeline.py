@@ -0,0 +1,126 @@
+import datetime
+from bisect import bisect_right
+from typing import Any
+
+from .resources import Page, StatuteAffectorAction
+from .utils import get_field, preorder
+
+INSERTED = {StatuteAffectorAction.Inserted.value}
+"""Actions that bring a unit into force after the codification's date."""
+
+REMOVED = {
+    StatuteAffectorAction.Repealed.value,
+    StatuteAffectorAction.Deleted.value,
+}
+"""Actions that take a unit, and all of its descendants, out of force."""
+
+VETOED = {StatuteAffectorAction.Vetoed.value}
+"""Actions that keep a unit from ever being in force."""
+
+
+def _event_date(event: Any) -> datetime.date | None:
+    if isinstance(v := get_field(event, "date"), str):
+        return datetime.date.fromisoformat(v)
+    return v
+
+
+class Timeline:
+    """Dates at which each unit of a `CodePage` is in force, derived from the
+    `StatuteAffector` events of its `history`, so that the codification can
+    be viewed as of any date:
+
+    1. A unit is in force from the codification's `date`, or from the
+    latest dated `Inserted` event if this comes later;
+    2. It ceases to be in force on the earliest dated `Repealed` or `Deleted`
+    event, and is never in force if `Vetoed`;
+    3. A unit is only in force while its parent is, e.g. the repeal of a
+    chapter repeals its articles.
+
+    Events without a date are ignored, as are actions that only change the
+    text of a unit, e.g. `Amended`.
+
+    The set of units in force only changes at the `boundaries`, the distinct
+    start and end dates. The snapshot of each interval between boundaries is
+    cached once materialized and later snapshots are derived from the
+    nearest earlier cached one by applying only the units that start or end
+    in between, rather than replaying every event of the tree.
+    """
+
+    __slots__ = (
+        "ids",
+        "pos",
+        "starts",
+        "ends",
+        "boundaries",
+        "_deltas",
+        "_cache",
+    )
+
+    def __init__(self, page: Page):
+        self.ids: list[str] = []
+        self.starts: list[datetime.date] = []
+        self.ends: list[datetime.date | None] = []
+        for _, parent, node in preorder(page.raw_units()):
+            if parent < 0:
+                start, end = page.date, None
+            else:  # a unit is only in force while its parent is
+                start, end = self.starts[parent], self.ends[parent]
+            for event in get_field(node, "history") or []:
+                if (date := _event_date(event)) is None:
+                    continue
+                if (action := get_field(event, "action")) in INSERTED:
+                    start = max(start, date)
+                elif action in REMOVED:
+                    end = date if end is None else min(end, date)
+                elif action in VETOED:
+                    end = start
+            if end is not None and end < start:
+                end = start
+            self.ids.append(get_field(node, "id"))
+            self.starts.append(start)
+            self.ends.append(end)
+        self.pos = {node_id: pos for pos, node_id in enumerate(self.ids)}
+        dates = {*self.starts, *(e for e in self.ends if e is not None)}
+        self.boundaries: list[datetime.date] = sorted(dates)
+        at = {date: k for k, date in enumerate(self.boundaries)}
+        self._deltas: list[tuple[list[int], list[int]]] = [
+            ([], []) for _ in self.boundaries
+        ]
+        for pos, (start, end) in enumerate(zip(self.starts, self.ends)):
+            self._deltas[at[start]][0].append(pos)
+            if end is not None:
+                self._deltas[at[end]][1].append(pos)
+        self._cache: dict[int, frozenset[int]] = {-1: frozenset()}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _snapshot(self, k: int) -> frozenset[int]:
+        """Positions of the units in force from the `k`-th boundary until the
+        next one, built from the nearest earlier cached snapshot."""
+        if (cached := self._cache.get(k)) is not None:
+            return cached
+        base = max(i for i in self._cache if i < k)
+        units = set(self._cache[base])
+        for added, removed in self._deltas[base + 1 : k + 1]:
+            units.update(added)
+            units.difference_update(removed)
+        self._cache[k] = snapshot = frozenset(units)
+        return snapshot
+
+    def positions(self, date: datetime.date) -> list[int]:
+        """Pre-order positions of the units in force on the `date`."""
+        k = bisect_right(self.boundaries, date) - 1
+        return sorted(self._snapshot(k))
+
+    def as_of(self, date: datetime.date) -> list[str]:
+        """Material paths, in pre-order, of the units in force on the
+        `date`."""
+        return [self.ids[pos] for pos in self.positions(date)]
+
+    def in_force(self, material_path: str, date: datetime.date) -> bool:
+        """Whether the unit with the `material_path` is in force on the
+        `date`, without materializing a snapshot."""
+        pos = self.pos[material_path]
+        end = self.ends[pos]
+        return self.starts[pos] <= date and (end is None or date < end)
@@ -1,4 +1,47 @@
-from .get import get_node_id
-from .layer import Layers
-from .set import set_node_ids
-from .walk import fetch_values_from_key
+from ..lazy import TYPE_CHECKING, lazy_exports
+
+if TYPE_CHECKING:
+    from .dump import dump_units
+    from .get import get_node_id, get_node_ids
+    from .index import TreeIndex
+    from .keys import from_sort_key, subtree_range, to_sort_key
+    from .layer import Layers
+    from .load import iter_units, load_header, load_page, load_yaml
+    from .merkle import TreeDiff, TreeHashes, diff_trees
+    from .set import build_branches, set_node_ids
+    from .walk import (
+        fetch_values_from_key,
+        get_field,
+        preorder,
+        walk_keys,
+    )
+
+_EXPORTS = {
+    "dump_units": ".dump",
+    "get_node_id": ".get",
+    "get_node_ids": ".get",
+    "TreeIndex": ".index",
+    "from_sort_key": ".keys",
+    "subtree_range": ".keys",
+    "to_sort_key": ".keys",
+    "Layers": ".layer",
+    "iter_units": ".load",
+    "load_header": ".load",
+    "load_page": ".load",
+    "load_yaml": ".load",
+    "TreeDiff": ".merkle",
+    "TreeHashes": ".merkle",
+    "diff_trees": ".merkle",
+    "build_branches": ".set",
+    "set_node_ids": ".set",
+    "fetch_values_from_key": ".walk",
+    "get_field": ".walk",
+    "preorder": ".walk",
+    "walk_keys": ".walk",
+}
+"""Lazily imported, see `statute_trees.__init__`; e.g. `load` requires yaml
+and `dump` requires pydantic."""
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
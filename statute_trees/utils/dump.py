@@ -0,0 +1,68 @@
+import json
+from functools import partial
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def shallow_dict(obj: Any) -> dict:
+    """Same key-value pairs, in the same order, that `.dict(exclude_none=True)`
+    would produce for the pydantic model `obj` but without converting nested
+    models: these are handed back to the encoder as they are reached."""
+    if not isinstance(obj, BaseModel):
+        raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+    excluded = obj.__exclude_fields__ or {}
+    return {
+        k: v
+        for k, v in obj.__dict__.items()
+        if v is not None and k not in excluded
+    }
+
+
+def dump_units(nodes: list, ensure_ascii: bool = True) -> str:
+    """Serialize the tree `nodes` (e.g. `StatuteUnit`, `CodeUnit`, `DocUnit`)
+    into the json string stored in `Page.units`.
+
+    The result is identical to
+    `json.dumps([node.dict(exclude_none=True) for node in nodes])` but the
+    C encoder walks the models directly, converting only one node at a time
+    via `shallow_dict()` instead of first copying the entire tree into
+    nested dicts.
+    """
+    try:
+        return json.dumps(
+            nodes, default=shallow_dict, ensure_ascii=ensure_ascii
+        )
+    except RecursionError:  # the C encoder recurses on each nesting
+        return "".join(_dump_deep(nodes, ensure_ascii))
+
+
+def _dump_deep(nodes: list, ensure_ascii: bool = True) -> list[str]:
+    """Slower, explicit-stack counterpart of `dump_units()` for trees nested
+    deeper than the recursion limit allows. Only scalars are passed to the
+    encoder and the output is the same, provided that all keys are strings.
+    """
+    encode = partial(json.dumps, ensure_ascii=ensure_ascii)
+    parts: list[str] = []
+    stack: list = [(nodes,)]  # a str is output as is, a 1-tuple is a value
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+            continue
+        obj = item[0]
+        if isinstance(obj, BaseModel):
+            obj = shallow_dict(obj)
+        if isinstance(obj, dict):
+            pending: list = []
+            for k, v in obj.items():
+                pending += [", ", f"{encode(str(k))}: ", (v,)]
+            stack += ["}", *reversed(pending[1:]), "{"]
+        elif isinstance(obj, (list, tuple)):
+            pending = []
+            for v in obj:
+                pending += [", ", (v,)]
+            stack += ["]", *reversed(pending[1:]), "["]
+        else:
+            parts.append(encode(obj, default=shallow_dict))
+    return parts
@@ -1,3 +1,41 @@
+from collections.abc import Iterable, Iterator
+
+from .walk import preorder
+
+
+def _segments(node_id: str) -> list[str]:
+    return node_id.rstrip(".").split(".")
+
+
+def _descend(nodes: list[dict], query_id: str, child_key: str) -> dict | None:
+    """Follow the sibling indexes encoded in the material path `query_id`,
+    e.g. "1.3.2." is the second child of the third node of `nodes` (where
+    "1." is the root set by `set_node_ids()`). Each node visited must bear
+    the expected id, otherwise the ids are not positional and `None` is
+    returned so that the caller can fall back to a search."""
+    if not nodes or not isinstance(first := nodes[0].get("id"), str):
+        return None
+    root = _segments(first)[:-1]
+    query = _segments(query_id)
+    if len(query) <= len(root) or query[: len(root)] != root:
+        return None
+    level, path = nodes, root
+    for segment in query[len(root) :]:
+        idx = int(segment) if segment.isdigit() else 0
+        if not level or not 0 < idx <= len(level):
+            return None
+        node, path = level[idx - 1], path + [segment]
+        if not isinstance(node, dict) or _segments(node["id"]) != path:
+            return None
+        level = node.get(child_key)
+    return node
+
+
+def _search(nodes: list[dict], child_key: str) -> Iterator[dict]:
+    """Pre-order traversal of the nested `nodes`."""
+    return (node for _, _, node in preorder(nodes, child_key))
+
+
 def get_node_id(
     nodes: list[dict],
     query_id: str,
@@ -5,6 +43,11 @@ def get_node_id(
 ) -> dict | None:
     """Return the first node matching the `query_id`, if it exists.
 
+    Since the material path of the `query_id` already encodes the position
+    of the node at each level, the tree is descended directly in O(depth);
+    only when the ids turn out to be non-positional, i.e. not set by
+    `set_node_ids()`, is the entire tree searched.
+
     Args:
         nodes (list[dict]): The deeply nested json list
         query_id (str): The id previously set by `set_tree_ids()`
@@ -12,10 +55,48 @@ def get_node_id(
     Returns:
         dict | None: The first node matching the query_id or None
     """
-    for node in nodes:
+    if match := _descend(nodes, query_id, child_key):
+        if match["id"] == query_id:
+            return match
+    for node in _search(nodes, child_key):
         if node["id"] == query_id:
             return node
-        if units := node.get(child_key, None):
-            if match := get_node_id(units, query_id, child_key):
-                return match
     return None
+
+
+def get_node_ids(
+    nodes: list[dict],
+    query_ids: Iterable[str],
+    child_key: str = "units",
+) -> dict[str, dict | None]:
+    """Batch variant of `get_node_id()`: each of the `query_ids` is first
+    resolved by descent and the remainder, if any, are all looked up in a
+    single traversal of the tree.
+
+    Args:
+        nodes (list[dict]): The deeply nested json list
+        query_ids (Iterable[str]): The ids previously set by `set_tree_ids()`
+
+    Returns:
+        dict[str, dict | None]: Each query id mapped to its first matching
+            node or None
+    """
+    found: dict[str, dict | None] = {}
+    missing: set[str] = set()
+    for query_id in query_ids:
+        if query_id in found:
+            continue
+        match = _descend(nodes, query_id, child_key)
+        if match and match["id"] == query_id:
+            found[query_id] = match
+        else:
+            found[query_id] = None
+            missing.add(query_id)
+    if missing:
+        for node in _search(nodes, child_key):
+            if node["id"] in missing:
+                found[node["id"]] = node
+                missing.discard(node["id"])
+                if not missing:
+                    break
+    return found
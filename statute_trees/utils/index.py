@@ -0,0 +1,118 @@
+import json
+from collections.abc import Iterator
+from typing import Any
+
+from .walk import get_field, preorder
+
+
+class TreeIndex:
+    """Flattened, pre-order view of a tree of units, built once so that it
+    can be queried repeatedly without walking the tree from its root.
+
+    Each node is assigned a position in pre-order, i.e. a parent precedes
+    its children and a subtree occupies the contiguous range of positions
+    from the node itself up to (but excluding) its `end`:
+
+    pos | id | parent | end
+    --:|:--|--:|--:
+    0 | 1.1. | -1 | 3
+    1 | 1.1.1. | 0 | 2
+    2 | 1.1.2. | 0 | 3
+    3 | 1.2. | -1 | 4
+
+    The nodes themselves are neither copied nor altered: the index works
+    over `StatuteUnit` / `CodeUnit` / `DocUnit` models and over their dict
+    counterparts alike.
+    """
+
+    __slots__ = ("nodes", "ids", "parents", "ends", "pos", "child_key")
+
+    def __init__(self, nodes: list, child_key: str = "units"):
+        self.child_key = child_key
+        self.nodes: list = []
+        self.ids: list[str] = []
+        self.parents: list[int] = []
+        self.ends: list[int] = []
+        for idx, parent, node in preorder(nodes, child_key):
+            self.nodes.append(node)
+            self.ids.append(get_field(node, "id"))
+            self.parents.append(parent)
+            self.ends.append(idx + 1)
+        for idx in reversed(range(len(self.nodes))):  # last descendant first
+            if (parent := self.parents[idx]) >= 0:
+                self.ends[parent] = max(self.ends[parent], self.ends[idx])
+        self.pos: dict[str, int] = {}
+        for idx, node_id in enumerate(self.ids):
+            self.pos.setdefault(node_id, idx)  # first match, like get_node_id
+
+    @classmethod
+    def from_nodes(cls, nodes: list, child_key: str = "units") -> "TreeIndex":
+        """Index the `nodes` of a tree, e.g. `Page.tree`."""
+        return cls(nodes, child_key)
+
+    @classmethod
+    def from_json(cls, units: str, child_key: str = "units") -> "TreeIndex":
+        """Index the `units` json string of a `Page` without creating any
+        model."""
+        return cls(json.loads(units), child_key)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.pos
+
+    def __getitem__(self, node_id: str) -> Any:
+        return self.nodes[self.pos[node_id]]
+
+    def get(self, node_id: str) -> Any | None:
+        if (idx := self.pos.get(node_id)) is not None:
+            return self.nodes[idx]
+        return None
+
+    def span(self, node_id: str) -> range:
+        """Pre-order positions of the subtree rooted at `node_id`."""
+        idx = self.pos[node_id]
+        return range(idx, self.ends[idx])
+
+    def subtree(self, node_id: str, include_self: bool = True) -> list:
+        """Nodes of the subtree rooted at `node_id` in pre-order."""
+        idx = self.pos[node_id]
+        return self.nodes[idx if include_self else idx + 1 : self.ends[idx]]
+
+    def subtree_ids(self, node_id: str, include_self: bool = True) -> list:
+        idx = self.pos[node_id]
+        return self.ids[idx if include_self else idx + 1 : self.ends[idx]]
+
+    def parent(self, node_id: str) -> Any | None:
+        """The node containing `node_id`; `None` for nodes at the root."""
+        idx = self.parents[self.pos[node_id]]
+        return self.nodes[idx] if idx >= 0 else None
+
+    def ancestors(self, node_id: str) -> list:
+        """Nodes containing `node_id`, from the root down to its parent."""
+        chain = []
+        idx = self.parents[self.pos[node_id]]
+        while idx >= 0:
+            chain.append(self.nodes[idx])
+            idx = self.parents[idx]
+        return chain[::-1]
+
+    def _children(self, parent: int) -> Iterator[int]:
+        idx = parent + 1
+        end = self.ends[parent] if parent >= 0 else len(self.nodes)
+        while idx < end:
+            yield idx
+            idx = self.ends[idx]
+
+    def children(self, node_id: str) -> list:
+        return [self.nodes[i] for i in self._children(self.pos[node_id])]
+
+    def siblings(self, node_id: str, include_self: bool = False) -> list:
+        """Nodes sharing the same parent as `node_id`, in order."""
+        idx = self.pos[node_id]
+        return [
+            self.nodes[i]
+            for i in self._children(self.parents[idx])
+            if include_self or i != idx
+        ]
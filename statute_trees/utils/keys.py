@@ -0,0 +1,57 @@
+from functools import cache
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+"""Base 36 digits, in ascending byte order, i.e. sqlite's default `BINARY`
+collation."""
+
+KEY_END = "~"
+"""Sorts after every digit so that `key + KEY_END` bounds all keys that
+start with `key`."""
+
+
+@cache
+def _encode(n: int) -> str:
+    digits = ""
+    while n:
+        n, r = divmod(n, 36)
+        digits = DIGITS[r] + digits
+    return DIGITS[len(digits)] + digits
+
+
+def to_sort_key(material_path: str) -> str:
+    """Order-preserving key of the `material_path`, e.g. "1.10." is "111a"
+    and "1.2." is "1112", so that keys sort like the units of a tree in
+    pre-order whereas material paths compare "1.10." before "1.2.".
+
+    Each segment of the path becomes its number in base 36 prefixed by its
+    count of digits: a longer number sorts after a shorter one, and no
+    segment is the prefix of another, so the key of a unit is the prefix of
+    the keys of all of its descendants, see `subtree_range()`.
+
+    Args:
+        material_path (str): The `id` of a unit, e.g. "1.3.2."
+
+    Returns:
+        str: The sort key, e.g. "111312"
+    """
+    return "".join(_encode(int(s)) for s in material_path[:-1].split("."))
+
+
+def from_sort_key(key: str) -> str:
+    """The material path of a `key` made by `to_sort_key()`."""
+    segments, i = [], 0
+    while i < len(key):
+        size = DIGITS.index(key[i])
+        segments.append(str(int(key[i + 1 : i + 1 + size], 36)))
+        i += 1 + size
+    return ".".join(segments) + "."
+
+
+def subtree_range(material_path: str) -> tuple[str, str]:
+    """Half-open range `[start, end)` of the sort keys of the unit with the
+    `material_path` and all of its descendants, e.g. for a query like
+    `sort_key >= ? AND sort_key < ?` that an index on the sort key can
+    serve with a single range scan; use `sort_key > start` to exclude
+    the unit itself."""
+    start = to_sort_key(material_path)
+    return start, start + KEY_END
@@ -1,5 +1,5 @@
 import string
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from enum import Enum
 from typing import NamedTuple
 
@@ -82,26 +82,72 @@ class Layers(Enum):
         label_key: str = "item",
         children_key: str = "units",
         level: int = 1,
+        labels: dict[int, str] | None = None,
     ) -> None:
         """Add a `label_key` (defaults to "item") to each node in the
-        `nodes` list recursively.
+        `nodes` list and, in turn, to the nodes of each `children_key`
+        (defaults to "units") of the node dict. For each level of nesting,
+        use the appropriate `ListType`.
 
-        Recursion happens on every `children_key` (defaults to
-        "units) of the node dict. For each level of recursion, use the
-        appropriate `ListType`.
+        The nested lists are traversed with an explicit stack rather than by
+        recursion so that the depth of the tree is not bound by the
+        recursion limit.
+
+        If a `labels` dict is supplied, the nodes are left as they are: each
+        label is instead added to `labels`, keyed by the `id()` of its node.
         """
-        if isinstance(nodes, list):
-            flag = False
-            for idx, node in enumerate(nodes, start=0):
+        if not isinstance(nodes, list):
+            return
+        # each frame: [remaining siblings, level, whether labels were added]
+        stack: list[list] = [[enumerate(nodes, start=0), level, False]]
+        while stack:
+            frame = stack[-1]
+            siblings, level, _ = frame
+            for idx, node in siblings:
                 if label_key not in node:  # only populate a certain key
                     item_type: ListType = self.get_item_type(level)
                     category: list = item_type.value
+                    if labels is None:
+                        node[label_key] = f"§{category[idx]}"
+                    else:
+                        labels[id(node)] = f"§{category[idx]}"
+                    # if any sibling requires an `item`, switch
+                    frame[2] = True
+                children = node.get(children_key)
+                if children and isinstance(children, list):
+                    sublevel = level + 1 if frame[2] else level
+                    stack.append([enumerate(children), sublevel, False])
+                    break
+            else:
+                stack.pop()
+
+    def label_each(
+        self,
+        nodes: Iterable[dict],
+        label_key: str = "item",
+        children_key: str = "units",
+        level: int = 1,
+        labels: dict[int, str] | None = None,
+    ) -> Iterator[dict]:
+        """Lazy counterpart of `layerize()` for nodes that are streamed
+        rather than loaded as a list: each node yielded, along with its
+        descendants, has already been labeled exactly as `layerize()` would
+        have done, whether in place or in the `labels` supplied."""
+        flag = False
+        for idx, node in enumerate(nodes, start=0):
+            if label_key not in node:
+                category: list = self.get_item_type(level).value
+                if labels is None:
                     node[label_key] = f"§{category[idx]}"
-                    flag = True  # if any of the siblings requires an `item`, switch
-                if node.get(children_key):
-                    self.layerize(
-                        node[children_key],
-                        label_key,
-                        children_key,
-                        level + 1 if flag else level,
-                    )
+                else:
+                    labels[id(node)] = f"§{category[idx]}"
+                flag = True
+            if node.get(children_key):
+                self.layerize(
+                    node[children_key],
+                    label_key,
+                    children_key,
+                    level + 1 if flag else level,
+                    labels,
+                )
+            yield node
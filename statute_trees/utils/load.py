@@ -0,0 +1,117 @@
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import yaml
+from yaml.composer import ComposerError
+from yaml.events import (
+    CollectionEndEvent,
+    CollectionStartEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+)
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""The libyaml-backed loader is several times faster than the pure python
+`SafeLoader` and produces the same data; it is only unavailable when PyYAML
+was installed without libyaml."""
+
+
+def load_yaml(file_path: Path) -> Any:
+    """Load the entire yaml file with the fastest available safe `Loader`.
+    The file is read as bytes so that the decoded text does not have to be
+    kept alive alongside the parsed data."""
+    with open(file_path, "rb") as f:
+        return yaml.load(f, Loader=Loader)
+
+
+def _skip(loader: yaml.SafeLoader):
+    """Consume the events of the next node without constructing it."""
+    depth = 0
+    while True:
+        event = loader.get_event()
+        if isinstance(event, CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, CollectionEndEvent):
+            depth -= 1
+        if depth == 0:
+            return
+
+
+def _construct(loader: yaml.SafeLoader) -> Any:
+    """Compose and construct only the next node of the event stream."""
+    node = loader.compose_node(None, None)  # type: ignore
+    return loader.construct_document(node)
+
+
+def _top_level_keys(loader: yaml.SafeLoader) -> Iterator[str]:
+    """Advance the `loader` to each key of the document's root mapping; the
+    caller must consume (construct or skip) the value of each key yielded."""
+    loader.get_event()  # stream start
+    loader.get_event()  # document start
+    if not isinstance(loader.get_event(), MappingStartEvent):
+        raise ValueError("Expected a mapping at the root of the document.")
+    loader.anchors = {}  # type: ignore # see yaml.composer.compose_document
+    while not loader.check_event(MappingEndEvent):
+        yield str(_construct(loader))
+
+
+def load_header(file_path: Path, skip: str = "units") -> dict:
+    """Load the root mapping of the yaml file except for the `skip` key,
+    whose events are parsed but never built into python objects. Pair with
+    `iter_units()` so that a giant tree is never loaded all at once.
+
+    Since the skipped node is never composed, its anchors are unknown; if a
+    later key aliases one of them, the entire file is loaded instead."""
+    data = {}
+    with open(file_path, "rb") as f:
+        loader = yaml.SafeLoader(f)
+        try:
+            for key in _top_level_keys(loader):
+                if key == skip:
+                    _skip(loader)
+                else:
+                    data[key] = _construct(loader)
+        except ComposerError:
+            data = load_yaml(file_path)
+            data.pop(skip, None)
+        finally:
+            loader.dispose()
+    return data
+
+
+def iter_units(file_path: Path, key: str = "units") -> Iterator[dict]:
+    """Stream each item of the sequence found in the `key` of the root
+    mapping, constructing one item at a time. Peak memory is bounded by the
+    largest item rather than by the entire file.
+
+    Streaming requires the event api of the pure python `SafeLoader`, so
+    this trades some speed for memory when compared to `load_yaml()`.
+
+    The other keys of the root mapping are composed (though not built) so
+    that the items can alias the anchors defined in them.
+    """
+    with open(file_path, "rb") as f:
+        loader = yaml.SafeLoader(f)
+        try:
+            for k in _top_level_keys(loader):
+                if k != key or not loader.check_event(SequenceStartEvent):
+                    loader.compose_node(None, None)  # type: ignore
+                    continue
+                loader.get_event()
+                while not loader.check_event(SequenceEndEvent):
+                    yield _construct(loader)
+                loader.get_event()
+        finally:
+            loader.dispose()
+
+
+def load_page(file_path: Path, stream: bool = False) -> tuple[dict, Iterable]:
+    """Separate the page `data` from its `units`, either fully loaded or,
+    when `stream` is set, lazily produced via `iter_units()`."""
+    if stream:
+        return load_header(file_path), iter_units(file_path)
+    data = load_yaml(file_path)
+    return data, data.get("units")
@@ -0,0 +1,179 @@
+import hashlib
+import json
+from functools import partial
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+from .dump import shallow_dict
+from .walk import preorder
+
+SKIPPED = ("id", "units")
+"""Keys that are not part of the content of a node: its position is not
+its content, and its children are hashed separately."""
+
+_encode = partial(
+    json.dumps, default=shallow_dict, sort_keys=True, separators=(",", ":")
+)
+
+
+def _fields(node: Any) -> dict:
+    return node.__dict__ if isinstance(node, BaseModel) else node
+
+
+def _digest(*parts: bytes) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part)
+    return h.digest()
+
+
+class TreeHashes:
+    """Merkle hashes of a tree of units (models or dicts) in pre-order: the
+    `own` hash of each node covers its content, i.e. all of its fields
+    (`item`, `caption`, `content`, `history` / `sources`, etc.) save for its
+    `id` and children, whereas its `digest` also covers the digests of its
+    children, in order. Two subtrees with the same digest are identical
+    regardless of their material paths; a model and its dict in the `units`
+    json of a page hash alike.
+
+    Nodes are numbered in a single `preorder()` pass and their digests
+    computed in reverse pre-order, i.e. children before their parents.
+    """
+
+    __slots__ = ("ids", "items", "own", "digests", "children", "roots", "pos")
+
+    def __init__(self, nodes: list, child_key: str = "units"):
+        self.ids: list[str] = []
+        self.items: list[str | None] = []
+        self.own: list[bytes] = []
+        self.children: list[list[int]] = []
+        self.roots: list[int] = []
+        for idx, parent, node in preorder(nodes, child_key):
+            (self.children[parent] if parent >= 0 else self.roots).append(idx)
+            fields = _fields(node)
+            content = {
+                k: v
+                for k, v in fields.items()
+                if v is not None and k not in SKIPPED
+            }
+            self.ids.append(fields.get("id"))
+            self.items.append(fields.get("item"))
+            self.own.append(_digest(_encode(content).encode()))
+            self.children.append([])
+        self.digests: list[bytes] = [b""] * len(self.ids)
+        for idx in reversed(range(len(self.ids))):
+            kids = [self.digests[k] for k in self.children[idx]]
+            self.digests[idx] = _digest(self.own[idx], *kids)
+        self.pos = {node_id: idx for idx, node_id in enumerate(self.ids)}
+
+    @classmethod
+    def from_json(cls, units: str, child_key: str = "units") -> "TreeHashes":
+        """Hash the `units` json string of a `Page` without creating any
+        model."""
+        return cls(json.loads(units), child_key)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def root(self) -> bytes:
+        """Digest of the entire tree."""
+        return _digest(*(self.digests[k] for k in self.roots))
+
+    def hexdigest(self, material_path: str) -> str:
+        """Digest of the subtree at the `material_path`."""
+        return self.digests[self.pos[material_path]].hex()
+
+
+class TreeDiff(NamedTuple):
+    """Changes between two versions of a tree, by material path. Only the
+    topmost node of an `added`, `removed` or `moved` subtree is reported."""
+
+    added: list[str]
+    removed: list[str]
+    modified: list[tuple[str, str]]  # (old, new) paths of changed content
+    moved: list[tuple[str, str]]  # (old, new) paths of identical subtrees
+
+
+def diff_trees(old: TreeHashes, new: TreeHashes) -> TreeDiff:
+    """Compare two versions of a tree, descending only into the subtrees
+    whose digests differ, so that the cost follows the extent of the change
+    rather than the size of the trees.
+
+    Within each pair of sibling lists, identical subtrees are matched by
+    digest first; the rest are paired in order among those with the same
+    `item` and compared by their `own` hash before descending into their
+    children. Unpaired nodes are `removed` / `added`, except that an
+    identical subtree removed from one parent and added under another is
+    also `moved`. A node is only `moved` if its path changed other than
+    through the path of its parent, e.g. when a preceding sibling was
+    inserted.
+
+    Args:
+        old (TreeHashes): The hashes of the prior version
+        new (TreeHashes): The hashes of the current version
+
+    Returns:
+        TreeDiff: The added, removed, modified and moved material paths
+    """
+    diff = TreeDiff([], [], [], [])
+    if old.root == new.root:
+        return diff
+    # each pair: (old siblings, new siblings, their parents' ids)
+    pairs = [(old.roots, new.roots, "", "")]
+    while pairs:
+        olds, news, old_parent, new_parent = pairs.pop()
+
+        def renamed(o: int, n: int) -> bool:
+            suffix = old.ids[o][len(old_parent) :]
+            return new.ids[n] != f"{new_parent}{suffix}"
+
+        by_digest: dict[bytes, list[int]] = {}
+        for n in reversed(news):
+            by_digest.setdefault(new.digests[n], []).append(n)
+        rest = []
+        for o in olds:
+            if same := by_digest.get(old.digests[o]):
+                if renamed(o, n := same.pop()):
+                    diff.moved.append((old.ids[o], new.ids[n]))
+            else:
+                rest.append(o)
+        if not rest and not any(by_digest.values()):
+            continue
+        by_item: dict[str | None, list[int]] = {}
+        for n in sorted(n for ns in by_digest.values() for n in ns)[::-1]:
+            by_item.setdefault(new.items[n], []).append(n)
+        for o in rest:
+            if not (candidates := by_item.get(old.items[o])):
+                diff.removed.append(old.ids[o])
+                continue
+            n = candidates.pop()
+            if old.own[o] != new.own[n]:
+                diff.modified.append((old.ids[o], new.ids[n]))
+            elif renamed(o, n):
+                diff.moved.append((old.ids[o], new.ids[n]))
+            pairs.append(
+                (old.children[o], new.children[n], old.ids[o], new.ids[n])
+            )
+        diff.added.extend(new.ids[n] for ns in by_item.values() for n in ns)
+    _match_moves(old, new, diff)
+    return diff
+
+
+def _match_moves(old: TreeHashes, new: TreeHashes, diff: TreeDiff):
+    """Pair removed and added subtrees with the same digest as moves."""
+    if not diff.removed or not diff.added:
+        return
+    removed: dict[bytes, list[str]] = {}
+    for path in reversed(diff.removed):
+        removed.setdefault(old.digests[old.pos[path]], []).append(path)
+    added, moved = [], set()
+    for path in diff.added:
+        if same := removed.get(new.digests[new.pos[path]]):
+            moved.add(old_path := same.pop())
+            diff.moved.append((old_path, path))
+        else:
+            added.append(path)
+    diff.added[:] = added
+    diff.removed[:] = [p for p in diff.removed if p not in moved]
@@ -1,9 +1,15 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
 def set_node_ids(
     nodes: list[dict],
     parent_id: str = "1.",
     child_key: str = "units",
 ):
-    """Recursive function updates nodes in place since list/dicts are mutable.
+    """Function updates nodes in place since list/dicts are mutable.
     Assumes that the nodes reprsent a deeply nested json, e.g.
 
     For each node in the `nodes` list, it will add a new `id` key and will
@@ -20,14 +26,76 @@ def set_node_ids(
     The child key of the tree will always be "units", unless the `child_key`
     is set to a different string.
 
+    The nested lists are traversed with an explicit stack rather than by
+    recursion so that the depth of the tree is not bound by the recursion
+    limit.
+
     Args:
         nodes (list[dict]): The list of dicts that
         parent_id (str, optional): The root node id. Defaults to "1.".
         child_key (str, optional): The node which represents a list of children nodes.
             Defaults to "units".
     """
-    if isinstance(nodes, list):
-        for counter, node in enumerate(nodes, start=1):
-            node["id"] = f"{parent_id}{str(counter)}."
-            if node.get(child_key, None):
-                set_node_ids(node[child_key], node["id"], child_key)
+    stack = [(nodes, parent_id)]
+    while stack:
+        siblings, prefix = stack.pop()
+        if isinstance(siblings, list):
+            for counter, node in enumerate(siblings, start=1):
+                id = node["id"] = f"{prefix}{counter}."
+                if children := node.get(child_key, None):
+                    stack.append((children, id))
+
+
+def build_branches(
+    units: Iterable[dict],
+    make: Callable[[dict, str, list], T],
+    parent_id: str = "1.",
+    child_key: str = "units",
+) -> Iterator[T]:
+    """Explicit-stack, post-order construction of a tree from nested `units`
+    where each node is created by `make(unit, id, children)` only after all
+    of its `children` have been made. The `id` is the material path of the
+    unit (see `set_node_ids()`); the `unit` is passed as is and still
+    contains its `child_key`, if any.
+
+    Nodes at the root are yielded as soon as each is complete, so streamed
+    `units` are consumed one root node at a time, and the depth of the tree
+    is not bound by the recursion limit.
+
+    Args:
+        units (Iterable[dict]): The nested units, e.g. from a yaml file
+        make (Callable[[dict, str, list], T]): Creates a node from the unit,
+            its material path and its list of previously made children
+        parent_id (str, optional): The root node id. Defaults to "1.".
+        child_key (str, optional): The key of the children of each unit.
+            Defaults to "units".
+
+    Yields:
+        Iterator[T]: Each node made from the `units` at the root
+    """
+    # each frame: (remaining siblings, their parent's id, made siblings,
+    # the parent unit awaiting its children or None for the root)
+    stack: list[tuple[Iterator, str, list, dict | None]] = [
+        (enumerate(units, start=1), parent_id, [], None)
+    ]
+    while stack:
+        siblings, prefix, made, parent = stack[-1]
+        for counter, unit in siblings:
+            id = f"{prefix}{str(counter)}."
+            if subunits := unit.get(child_key):
+                stack.append((enumerate(subunits, start=1), id, [], unit))
+                break
+            node = make(unit, id, [])
+            if len(stack) == 1:
+                yield node
+            else:
+                made.append(node)
+        else:
+            stack.pop()
+            if parent is None:
+                continue
+            node = make(parent, prefix, made)
+            if len(stack) == 1:
+                yield node
+            else:
+                stack[-1][2].append(node)
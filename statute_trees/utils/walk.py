@@ -1,4 +1,5 @@
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple
 
 
 def fetch_values_from_key(data: dict, key: str) -> Iterator:
@@ -19,6 +20,11 @@ def fetch_values_from_key(data: dict, key: str) -> Iterator:
         # remove from stack
         evaluate_data = stack.pop()
 
+        # a list nested in a list, e.g. {"a": [[{...}]]}: stack its items
+        if isinstance(evaluate_data, list):
+            stack += (i for i in evaluate_data if isinstance(i, (dict, list)))
+            continue
+
         # yield if the key value pair is found
         if (
             not isinstance(evaluate_data, str)
@@ -36,4 +42,125 @@ def fetch_values_from_key(data: dict, key: str) -> Iterator:
                 if isinstance(v, dict):
                     stack.append(v)
                 if isinstance(v, list):
-                    stack += v
+                    stack += (i for i in v if isinstance(i, (dict, list)))
+
+
+def get_field(node: Any, key: str) -> Any:
+    """Value of the `key` whether the node is a dict, e.g. from the `units`
+    json of a `Page`, or a model, e.g. a `StatuteUnit` or a `history` event;
+    `None` if missing."""
+    if isinstance(node, dict):
+        return node.get(key)
+    return getattr(node, key, None)
+
+
+def preorder(
+    nodes: list | None, child_key: str = "units"
+) -> Iterator[tuple[int, int, Any]]:
+    """Traverse a tree of units (models or dicts) in pre-order with an
+    explicit stack, so that depth is not bound by the recursion limit.
+
+    Args:
+        nodes (list | None): The root units, e.g. `Page.tree`
+        child_key (str, optional): The key of the children of a unit.
+            Defaults to "units".
+
+    Yields:
+        Iterator[tuple[int, int, Any]]: The position of each node, that of
+            its parent (-1 for the roots) and the node itself
+    """
+    stack: list[tuple[int, Iterator]] = [(-1, iter(nodes or []))]
+    pos = 0
+    while stack:
+        parent, siblings = stack[-1]
+        if (node := next(siblings, None)) is None:
+            stack.pop()
+            continue
+        yield pos, parent, node
+        if children := get_field(node, child_key):
+            stack.append((pos, iter(children)))
+        pos += 1
+
+
+class Hit(NamedTuple):
+    """A value found by `walk_keys()`."""
+
+    material_path: str | None  # of the node containing the key
+    key: str
+    value: Any
+
+
+def _fields(obj: Any) -> dict | None:
+    """The key-value pairs of a dict or of a (pydantic) model."""
+    if isinstance(obj, dict):
+        return obj
+    if hasattr(obj, "__fields__"):
+        return obj.__dict__
+    return None
+
+
+def walk_keys(
+    data: Any,
+    keys: str | Iterable[str],
+    child_key: str | None = None,
+    id_key: str = "id",
+    parent_id: str = "1.",
+) -> Iterator[Hit]:
+    """Collect the values of all `keys` in a single pre-order traversal of
+    the nested `data`: a dict, a model such as a `CodeUnit`, or a list of
+    either. Like `fetch_values_from_key()`, `None` values are skipped.
+
+    Each value is reported with the material path of the node that contains
+    it, i.e. the node's `id_key`. When a node has no id yet, e.g. units
+    loaded from yaml, it is numbered from the `parent_id` as `set_node_ids()`
+    would have done if walking through a `child_key`; otherwise the nearest
+    enclosing id, if any, is reported.
+
+    Args:
+        data (Any): The nested dicts / models, or a list of them
+        keys (str | Iterable[str]): The keys to collect, e.g. "history"
+        child_key (str | None, optional): When set, e.g. to "units", only
+            nodes reachable through this key are visited, rather than every
+            nested dict, list and model. Defaults to None.
+        id_key (str, optional): The key holding the material path of a
+            node. Defaults to "id".
+        parent_id (str, optional): The id of the root, for nodes without
+            their own. Defaults to "1.".
+
+    Yields:
+        Iterator[Hit]: The material path, key and value of each match
+    """
+    wanted = {keys} if isinstance(keys, str) else set(keys)
+    roots = data if isinstance(data, list) else [data]
+    # each frame: (remaining items, their parent's material path)
+    stack: list[tuple[Iterator, str | None]] = [
+        (enumerate(roots, start=1), parent_id if child_key else None)
+    ]
+    while stack:
+        items, prefix = stack[-1]
+        for counter, item in items:
+            if isinstance(item, list):  # nested lists keep their container
+                stack.append((enumerate(item, start=1), prefix))
+                break
+            if (fields := _fields(item)) is None:
+                continue
+            if not (path := fields.get(id_key)):
+                path = f"{prefix}{counter}." if child_key else prefix
+            for key, value in fields.items():
+                if key in wanted and value is not None:
+                    yield Hit(path, key, value)
+            if child_key:
+                if children := fields.get(child_key):
+                    stack.append((enumerate(children, start=1), path))
+                    break
+            else:
+                nested = [
+                    v
+                    for v in fields.values()
+                    if isinstance(v, (dict, list)) or hasattr(v, "__fields__")
+                ]
+                if nested:
+                    stack.append((enumerate(nested, start=1), path))
+                    break
+        else:
+            stack.pop()
@@ -0,0 +1,46 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from statute_trees import CodePage, logs
+from statute_trees.logs import configure_logging
+
+DATA = Path(__file__).parent / "data"
+
+
+@pytest.fixture
+def data_dir() -> Path:
+    return DATA  # read-only, hence no copy via pytest-datadir
+
+
+@pytest.fixture
+def civil_page(data_dir) -> CodePage:
+    return CodePage.build(data_dir / "codification.yaml")
+
+
+def _corpus(datadir: Path, folder: str, name: str) -> Path:
+    (root := datadir / folder).mkdir()
+    shutil.copy(datadir / name, root)
+    return root
+
+
+@pytest.fixture
+def codifications(shared_datadir) -> Path:
+    """A corpus folder with a copy of `codification.yaml` as its only file."""
+    return _corpus(shared_datadir, "codifications", "codification.yaml")
+
+
+@pytest.fixture
+def documents(shared_datadir) -> Path:
+    """A corpus folder with a copy of `document.yaml` as its only file."""
+    return _corpus(shared_datadir, "documents", "document.yaml")
+
+
+@pytest.fixture
+def logged(monkeypatch) -> list[str]:
+    """Messages logged during the test."""
+    messages: list[str] = []
+    monkeypatch.setattr(logs, "_configured", False)
+    configure_logging([{"sink": messages.append, "format": "{message}"}])
+    return messages
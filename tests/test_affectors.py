@@ -0,0 +1,70 @@
+from statute_trees import AffectorIndex, CodePage
+from statute_trees.affectors import Affected
+
+
+def scan(page: CodePage, category: str, serial_id: str) -> list[Affected]:
+    """The full scan of the tree that the index replaces."""
+    return [
+        Affected(page.id, unit.id, event.action)
+        for unit in CodePage.__fields__["tree"].type_.walk(page.tree)
+        for event in unit.history or []
+        if getattr(event, "statute_category", None) == category
+        and event.statute_serial_id == serial_id
+    ]
+
+
+def test_affector_index_by_statute(civil_page):
+    index = AffectorIndex.from_pages([civil_page])
+    assert index.by_statute("Executive Order No. 292") == [
+        Affected(civil_page.id, "1.1.1.2.", "Adopted"),
+        Affected(civil_page.id, "1.1.1.3.", "Adopted"),
+    ]
+    assert index.by_serial("EO", "292", "Sec. 23") == [
+        Affected(civil_page.id, "1.1.1.3.", "Adopted"),
+    ]
+    assert index.by_serial("eo", "292", "Section 99") == []
+    assert index.by_statute("Republic Act No. 10572") == []
+    for category, serial_id in index.statutes:
+        assert index.by_serial(category, serial_id) == scan(
+            civil_page, category, serial_id
+        )
+
+
+def test_affector_index_by_citation(civil_page):
+    index = AffectorIndex.from_pages([civil_page])
+    assert index.by_citation("220 Phil. 422") == [
+        Affected(civil_page.id, "1.1.1.2.", "Interpreted")
+    ]
+    assert index.by_citation("not a citation") == []
+
+
+def test_affector_index_from_units_json(civil_page):
+    from_tree = AffectorIndex.from_pages([civil_page])
+    assert civil_page.units
+    civil_page.drop("tree")
+    from_json = AffectorIndex.from_pages([civil_page])
+    assert civil_page.__dict__["tree"] is None  # not derived from the units
+    assert from_json.statutes == from_tree.statutes
+    assert from_json.citations == from_tree.citations
+
+
+def test_affector_index_incremental(civil_page):
+    other = civil_page.copy(update={"id": "other"})
+    index = AffectorIndex.from_pages([civil_page, other])
+    assert len(index) == 2 and "other" in index
+    assert len(index.by_statute("Executive Order No. 292")) == 4
+    index.add(other)  # replaces rather than duplicates
+    assert len(index.by_statute("Executive Order No. 292")) == 4
+    index.remove("other")
+    assert index.statutes == AffectorIndex.from_pages([civil_page]).statutes
+    index.remove(civil_page.id)
+    assert not index.statutes and not index.citations and not len(index)
+
+
+def test_affector_index_save_and_load(civil_page, tmp_path):
+    index = AffectorIndex.from_pages([civil_page])
+    loaded = AffectorIndex.load(index.save(tmp_path / "affectors.json"))
+    assert loaded.statutes == index.statutes
+    assert loaded.citations == index.citations
+    loaded.remove(civil_page.id)
+    assert not loaded.statutes and not loaded.citations
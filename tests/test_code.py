@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 import yaml
 
@@ -115,3 +117,12 @@ def test_codification_units_with_history(code_obj):
             }
         ],
     }
+
+
+def test_codification_units_not_mutated(code_obj):
+    units = code_obj["units"]
+    snapshot = copy.deepcopy(units)
+    kept = list(CodeUnit.create_branches(units, mutate=False))
+    assert units == snapshot
+    assert kept == list(CodeUnit.create_branches(units))
+    assert units != snapshot  # consumed in place by default
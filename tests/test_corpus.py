@@ -0,0 +1,32 @@
+from statute_trees import CodePage, DocPage, StatutePage
+from statute_trees.corpus import build_corpus, discover
+
+
+def test_discover_statute_details(shared_datadir):
+    assert discover(shared_datadir / "statutes", "**/details.yaml") == [
+        shared_datadir / "statutes" / "const" / "1987" / "details.yaml"
+    ]
+
+
+def test_build_corpus_serially(shared_datadir):
+    results = list(
+        build_corpus(StatutePage, shared_datadir / "statutes", workers=1)
+    )
+    assert len(results) == 1
+    assert results[0].ok
+    assert results[0].page.id == "const-1987-october-15-1986"
+
+
+def test_build_corpus_in_pool(codifications):
+    (codifications / "bad.yaml").write_text("title: Missing date and base\n")
+    results = list(build_corpus(CodePage, codifications, workers=2))
+    assert [r.path.name for r in results] == ["bad.yaml", "codification.yaml"]
+    bad, civil = results
+    assert not bad.ok and bad.error
+    assert civil.ok and isinstance(civil.page, CodePage)
+
+
+def test_build_corpus_unordered(documents):
+    results = list(build_corpus(DocPage, documents, workers=2, ordered=False))
+    assert {r.path.name for r in results} == {"document.yaml"}
+    assert all(r.ok for r in results)
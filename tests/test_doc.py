@@ -1,8 +1,12 @@
+import copy
+import pickle
+
 import pytest
 import yaml
 
-from statute_trees import DocUnit
+from statute_trees import DocPage, DocUnit
 from statute_trees.resources import EventStatute
+from statute_trees.utils import dump_units
 
 
 @pytest.fixture
@@ -139,3 +143,52 @@ def test_document_units_with_layers_and_sources(doc_obj):
             }
         ],
     }
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_fused_build_matches_separate_passes(shared_datadir, stream):
+    path = shared_datadir / "document.yaml"
+    page = DocPage.build(path)
+    fused = DocPage.build(path, stream=stream, fused=True)
+    assert fused.__dict__["units"] is not None  # serialized by the build
+    assert fused.units == page.units
+    assert fused.tree == page.tree
+    rows = list(DocUnit.searchables(page.id, page.tree))
+    assert rows and list(fused.searchables()) == rows
+    assert list(page.searchables()) == rows  # not fused, walks the tree
+    assert list(pickle.loads(pickle.dumps(fused)).searchables()) == rows
+
+
+def test_fuse_branches_labels_like_layerize(doc_obj):
+    units = doc_obj["units"]
+    expected = list(DocUnit.create_branches(copy.deepcopy(units)))
+    fused = DocUnit.fuse_branches(units, "pk")
+    assert fused.units == expected
+    assert [r["material_path"] for r in fused.rows] == [
+        r["material_path"] for r in DocUnit.searchables("pk", expected)
+    ]
+
+
+@pytest.mark.parametrize("streamed", [False, True])
+def test_document_units_not_mutated(doc_obj, streamed):
+    units = doc_obj["units"]
+    snapshot = copy.deepcopy(units)
+    source = iter(units) if streamed else units
+    kept = list(DocUnit.create_branches(source, mutate=False))
+    assert units == snapshot
+    assert kept == list(DocUnit.create_branches(copy.deepcopy(units)))
+    fused = DocUnit.fuse_branches(units, "pk", mutate=False)
+    assert units == snapshot
+    assert fused.units == kept
+
+
+def test_copy_of_fused_page_resets_rows(shared_datadir):
+    path = shared_datadir / "document.yaml"
+    fused = DocPage.build(path, fused=True)
+    assert list(fused.searchables())
+    root = fused.tree[0].copy(update={"units": []})
+    copied = fused.copy(update={"tree": [root]})
+    expected = list(DocUnit.searchables(copied.id, [root]))
+    assert list(copied.searchables()) == expected
+    assert copied.units == dump_units([root])  # not the prior json
+    assert list(fused.searchables())  # the original is left as is
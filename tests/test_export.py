@@ -0,0 +1,89 @@
+import sqlite3
+
+import pytest
+
+from statute_trees import CodePage, DocPage, StatutePage, export_pages
+from statute_trees.export import columns, page_spec, unit_rows, unit_spec
+from statute_trees.utils import subtree_range
+
+
+@pytest.mark.parametrize(
+    "page_cls, path",
+    [
+        (CodePage, "codification.yaml"),
+        (DocPage, "document.yaml"),
+        (StatutePage, "statutes/const/1987/details.yaml"),
+    ],
+)
+def test_export_pages(shared_datadir, tmp_path, page_cls, path):
+    page = page_cls.build(shared_datadir / path)
+    other = page.copy(update={"id": f"{page.id}-copy"})
+    db = tmp_path / "export.db"
+    report = export_pages(db, page_cls, [page, other], batch=3)
+    expected = list(unit_rows(page, unit_spec(page_cls)))
+    assert report.pages == 2
+    assert report.units == len(expected) * 2
+
+    table, units = page_spec(page_cls).name, unit_spec(page_cls).name
+    with sqlite3.connect(db) as conn:
+        assert conn.execute(f"select id, units from {table}").fetchall() == [
+            (page.id, page.units),
+            (other.id, other.units),
+        ]
+        fk = unit_spec(page_cls).columns[0].name
+        rows = conn.execute(
+            f"select * from {units} where {fk} = ? order by rowid", (page.id,)
+        ).fetchall()
+        assert rows == expected
+        indexes = {
+            r[0]
+            for r in conn.execute(
+                "select name from sqlite_master where type = 'index'"
+            )
+        }
+        assert f"idx_{units}_key" in indexes
+        assert f"idx_{units}_item" in indexes
+        assert f"idx_{units}_content" not in indexes  # see fts
+        word = page.title.split()[0]
+        assert conn.execute(
+            f"select rowid from {table}_fts where {table}_fts match ?",
+            (f'"{word}"',),
+        ).fetchall() == [(1,), (2,)]
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute(f"insert into {table} (id) values (?)", (page.id,))
+
+        top = next(iter(page.tree[0].units or []), page.tree[0])
+        start, end = subtree_range(top.id)
+        query = (
+            f"select material_path from {units} where {fk} = ? and sort_key"
+            " >= ? and sort_key < ? order by sort_key"
+        )
+        args = (page.id, start, end)
+        assert [r[0] for r in conn.execute(query, args)] == [
+            u.id for u in page_cls.__fields__["tree"].type_.walk([top])
+        ]
+        plan = conn.execute(f"explain query plan {query}", args).fetchall()
+        assert f"idx_{units}_key" in plan[0][-1]
+        assert "TEMP B-TREE" not in str(plan)  # no sort for the order by
+
+    export_pages(db, page_cls, [page])  # replaces the prior tables
+    with sqlite3.connect(db) as conn:
+        assert conn.execute(f"select count(*) from {table}").fetchone() == (1,)
+
+
+def test_columns_from_field_extras():
+    cols = {c.name: c for c in columns(CodePage)}
+    assert "tree" not in cols and "emails" not in cols
+    assert cols["created"].type == "REAL"
+    assert cols["variant"].type == "INTEGER"
+    assert cols["date"].index and not cols["date"].fts
+    assert cols["title"].fts
+    unit_cols = [c.name for c in unit_spec(CodePage).columns]
+    assert unit_cols == [
+        "codification_id",
+        "item",
+        "caption",
+        "content",
+        "material_path",
+        "sort_key",
+    ]
@@ -0,0 +1,48 @@
+import os
+import re
+import subprocess
+import sys
+
+HEAVY = {
+    "citation_utils",
+    "dateutil",
+    "loguru",
+    "pydantic",
+    "slugify",
+    "statute_patterns",
+    "yaml",
+}
+
+
+def imported(code: str, cwd) -> set[str]:
+    """Top-level packages of the modules imported by `code`, per
+    `python -X importtime`; see benchmarks/bench_import.py for timings."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, sys.path))}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        env=env,
+        check=True,
+    )
+    pattern = re.compile(r"import time:\s+\d+ \|\s+\d+ \|\s+([\w.]+)")
+    found = set()
+    for line in proc.stderr.splitlines():
+        if m := pattern.match(line):
+            found.add(m.group(1).split(".")[0])
+    return found
+
+
+def test_import_is_light_and_side_effect_free(tmp_path):
+    modules = imported("import statute_trees, statute_trees.utils", tmp_path)
+    assert "statute_trees" in modules
+    assert not HEAVY & modules
+    assert not (tmp_path / "logs").exists()
+
+
+def test_import_of_trees_skips_unused_dependencies(tmp_path):
+    modules = imported("from statute_trees import CodePage", tmp_path)
+    assert {"pydantic", "statute_patterns"} <= modules
+    assert not {"citation_utils", "loguru"} & modules
+    assert not (tmp_path / "logs").exists()
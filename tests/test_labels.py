@@ -0,0 +1,131 @@
+import pickle
+
+import pytest
+import yaml
+
+from statute_trees import CodePage, StatutePage
+from statute_trees.labels import LabelIndex, LocatorResolver, fold_label
+
+
+@pytest.fixture
+def const(shared_datadir) -> StatutePage:
+    details = shared_datadir / "statutes" / "const" / "1987" / "details.yaml"
+    return StatutePage.build(details)
+
+
+@pytest.fixture
+def code(tmp_path) -> CodePage:
+    def event(locator):
+        return {"locator": locator, "statute": "1987 Constitution"}
+
+    data = {
+        "title": "Sample Code",
+        "description": "Sample code with constitutional history.",
+        "date": "June 18, 1949",
+        "base": "Republic Act No. 386",
+        "units": [
+            {
+                "item": "Article 1",
+                "content": "First.",
+                "history": [
+                    event("Article II > Sec. 1"),
+                    event("Article XIX"),
+                    {"locator": "Section 1", "statute": "Act No. 1"},
+                ],
+                "units": [
+                    {
+                        "item": "Paragraph 1",
+                        "content": "Second.",
+                        "history": [event("Article III > Section 1")],
+                    }
+                ],
+            }
+        ],
+    }
+    (path := tmp_path / "code.yaml").write_text(yaml.safe_dump(data))
+    return CodePage.build(path)
+
+
+@pytest.mark.parametrize(
+    "item, folded",
+    [
+        ("Section 18", "section 18"),
+        ("Sec. 18.", "section 18"),
+        ("SECTION 18", "section 18"),
+        ("Article  2,", "article 2"),
+        ("(a)", "a"),
+    ],
+)
+def test_fold_label(item, folded):
+    assert fold_label(item) == folded
+
+
+def test_label_index_duplicates_and_nesting(const):
+    index = LabelIndex(const.tree)
+    sections = index.find("Section 1")
+    assert len(sections) > 1  # one per article
+    assert index.find("Article II > Sec. 1") == ["1.3.1.1."]
+    assert index.find("article iii>section 1.") == ["1.4.1."]
+    assert index.find("Article III > Article II > Section 1") == []
+    assert set(index.find("Article II > Section 1")) < set(sections)
+    assert index.find("Section 1000") == []
+
+
+def test_label_index_of_units_json(const):
+    from_tree = LabelIndex(const.tree)
+    from_json = LabelIndex(yaml.safe_load(const.units))
+    assert from_json.find("Section 1") == from_tree.find("Section 1")
+
+
+def test_locator_resolver(const, code):
+    resolver = LocatorResolver.from_pages([const])
+    assert ("const", "1987") in resolver
+    assert resolver.resolve("CONST", "1987", "Article II > Section 1") == [
+        "1.3.1.1."
+    ]
+    resolved, unresolved = resolver.resolve_events([code])
+    assert [(r.material_path, r.statute_paths) for r in resolved] == [
+        ("1.1.", ("1.3.1.1.",)),
+        ("1.1.1.", ("1.4.1.",)),
+    ]
+    assert [(r.statute_category, r.locator) for r in unresolved] == [
+        ("const", "Article XIX"),
+        ("act", "Section 1"),
+    ]
+
+
+def test_label_index_prefix(const):
+    index = const.labels
+    tens = index.find("Article II > Section 1*")
+    assert tens == [
+        index.ids[i]
+        for i in range(len(index))
+        if index.labels[i]
+        in ("section 1", *(f"section 1{n}" for n in range(10)))
+        and index.ids[i].startswith("1.3.")
+    ]
+    assert len(tens) > 1 and tens[0] == "1.3.1.1."
+    assert index.find("Sec. 1*") == [
+        index.ids[i] for i in index.starting_with("section 1")
+    ]
+    assert index.find("Section 99*") == []
+
+
+def test_page_labels(const):
+    assert const._labels is None  # not made by build()
+    index = const.labels
+    assert const.labels is index
+    restored = LabelIndex.loads(index.dumps())
+    assert restored.find("Article II > Section 1*") == index.find(
+        "Article II > Section 1*"
+    )
+    assert pickle.loads(pickle.dumps(const)).labels.ids == index.ids
+    copied = const.copy(update={"tree": const.tree[0].units[:1]})
+    assert len(copied.labels) < len(index)
+
+
+def test_page_labels_from_units(const):
+    const.units
+    const.drop("tree")
+    assert const.labels.find("Article II > Section 1") == ["1.3.1.1."]
+    assert const.__dict__["tree"] is None  # not derived from the units
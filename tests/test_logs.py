@@ -0,0 +1,68 @@
+from statute_trees import CodePage
+from statute_trees.corpus import build_corpus
+from statute_trees.logs import ErrorCollector, collecting
+from statute_trees.resources import EventStatute
+
+
+def test_collector_aggregates_and_caps():
+    errors = ErrorCollector(max_per_source=2, log=False)
+    for i in range(5):
+        errors.record("kind_a", f"message {i}", source="a.yaml")
+    errors.record("kind_b", "message", source="b.yaml")
+    report = errors.report()
+    assert report.total == 6
+    assert report.by_kind == {"kind_a": 5, "kind_b": 1}
+    assert report.by_source == {"a.yaml": 5, "b.yaml": 1}
+    assert report.samples["a.yaml"] == ["message 0", "message 1"]
+    assert report.dropped == 3
+
+
+def test_collecting_attributes_source():
+    with collecting("sample.yaml") as errors:
+        EventStatute(statute="Not A Statute", locator="Section 1")
+    report = errors.report()
+    assert report.by_kind == {"unmatched_statute": 1}
+    assert report.by_source == {"sample.yaml": 1}
+
+
+def test_corpus_error_report(codifications):
+    src = codifications / "codification.yaml"
+    src.write_text(
+        src.read_text().replace("Executive Order No. 200", "Unknown No. 1")
+    )
+    summary = ErrorCollector(log=False)
+    results = list(build_corpus(CodePage, codifications, collector=summary))
+    assert results[0].ok
+    assert results[0].issues.total == 1
+    report = summary.report()
+    assert report.by_kind == {"unmatched_statute": 1}
+    assert report.by_source == {str(src): 1}
+
+
+def test_collector_logs_kept_messages_when_recorded(logged):
+    errors = ErrorCollector(max_per_source=1)
+    errors.record("kind_a", "first", source="a.yaml")
+    assert logged == ["a.yaml: first\n"]
+    errors.record("kind_a", "second", source="a.yaml")
+    assert len(logged) == 1
+
+
+def test_corpus_logs_absorbed_samples(codifications, logged):
+    src = codifications / "codification.yaml"
+    src.write_text(
+        src.read_text().replace("Executive Order No. 200", "Unknown No. 1")
+    )
+    list(
+        build_corpus(
+            CodePage, codifications, workers=2, collector=ErrorCollector()
+        )
+    )
+    assert len(logged) == 1
+    assert logged[0].startswith(f"{src}: No rule from")
+
+
+def test_errors_outside_collecting_are_all_logged(logged):
+    for i in range(30):
+        EventStatute(statute=f"Bogus {i}", locator="Section 1")
+    assert len(logged) == 30
+    assert logged[-1].startswith("<unknown>: No rule from")
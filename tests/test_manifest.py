@@ -0,0 +1,103 @@
+import os
+
+from statute_trees import CodePage, DocPage, StatutePage
+from statute_trees.corpus import build_corpus
+from statute_trees.manifest import BuildManifest, content_digest
+
+
+def test_statute_digest_includes_unit_files(shared_datadir):
+    folder = shared_datadir / "statutes" / "const" / "1987"
+    details = folder / "details.yaml"
+    before = content_digest(StatutePage, details)
+    (folder / "const1987.yaml").write_text("- item: Section 1\n")
+    assert content_digest(StatutePage, details) != before
+
+
+def test_manifest_reuses_unchanged_pages(codifications, tmp_path):
+    first = list(
+        build_corpus(
+            CodePage, codifications, manifest=BuildManifest.load(tmp_path)
+        )
+    )
+    assert [r.cached for r in first] == [False]
+
+    manifest = BuildManifest.load(tmp_path)
+    assert len(manifest.entries) == 1
+    second = list(build_corpus(CodePage, codifications, manifest=manifest))
+    assert [r.cached for r in second] == [True]
+    assert second[0].page == first[0].page
+
+
+def test_manifest_rebuilds_changed_pages(codifications, tmp_path):
+    list(
+        build_corpus(
+            CodePage, codifications, manifest=BuildManifest.load(tmp_path)
+        )
+    )
+    src = codifications / "codification.yaml"
+    src.write_text(src.read_text().replace("June 18, 1949", "June 18, 1950"))
+    results = list(
+        build_corpus(
+            CodePage, codifications, manifest=BuildManifest.load(tmp_path)
+        )
+    )
+    assert [r.cached for r in results] == [False]
+    assert results[0].page.date.year == 1950
+
+
+def test_manifest_shared_across_roots(codifications, documents, tmp_path):
+    list(
+        build_corpus(
+            CodePage, codifications, manifest=BuildManifest.load(tmp_path)
+        )
+    )
+    list(
+        build_corpus(DocPage, documents, manifest=BuildManifest.load(tmp_path))
+    )
+    manifest = BuildManifest.load(tmp_path)
+    assert len(manifest.entries) == 2  # neither run dropped the other's
+    outputs = sorted(tmp_path.glob("*/*.pkl"))
+    assert len(outputs) == 2
+
+    results = list(build_corpus(CodePage, codifications, manifest=manifest))
+    assert [r.cached for r in results] == [True]
+
+    (documents / "document.yaml").unlink()
+    list(
+        build_corpus(
+            CodePage, codifications, manifest=BuildManifest.load(tmp_path)
+        )
+    )
+    manifest = BuildManifest.load(tmp_path)
+    assert list(manifest.entries) == [str(codifications / "codification.yaml")]
+    assert sorted(tmp_path.glob("*/*.pkl")) == [
+        tmp_path / e.output for e in manifest.entries.values()
+    ]
+
+
+def test_manifest_outputs_per_source_path(codifications, tmp_path):
+    (codifications / "copy").mkdir()
+    src, twin = (
+        codifications / "codification.yaml",
+        codifications / "copy" / "codification.yaml",
+    )
+    twin.write_bytes(src.read_bytes())  # same name and contents
+    os.utime(twin, (0, 0))
+    list(
+        build_corpus(
+            CodePage, codifications, manifest=BuildManifest.load(tmp_path)
+        )
+    )
+    manifest = BuildManifest.load(tmp_path)
+    outputs = {e.output for e in manifest.entries.values()}
+    assert len(manifest.entries) == len(outputs) == 2
+
+    results = list(build_corpus(CodePage, codifications, manifest=manifest))
+    assert [r.cached for r in results] == [True, True]
+    assert [r.page.modified for r in results] == [
+        src.stat().st_mtime,
+        twin.stat().st_mtime,
+    ]
+    twin.unlink()
+    list(build_corpus(CodePage, codifications, manifest=manifest))
+    assert len(list(tmp_path.glob("*/*.pkl"))) == 1
@@ -0,0 +1,82 @@
+import datetime
+
+import pytest
+from dateutil.parser import parse
+from statute_patterns import extract_rule
+
+from statute_trees import CodeUnit
+from statute_trees.memo import (
+    cache_clear,
+    cache_stats,
+    cached_citation,
+    cached_date,
+    cached_rule,
+    cached_serial_id,
+    collect_citations,
+    configure_caches,
+    resolve_citations,
+)
+from statute_trees.resources import EventStatute
+from statute_trees.utils import load_yaml
+
+
+def test_cached_rule():
+    cache_clear()
+    assert cached_rule("Republic Act No. 386") == extract_rule(
+        "Republic Act No. 386"
+    )
+    for _ in range(3):
+        EventStatute(statute="Republic Act No. 386", locator="Article 2")
+    stats = cache_stats()["rule"]
+    assert stats.misses == 1
+    assert stats.hits == 3
+
+
+def test_cached_serial_id():
+    assert cached_serial_id("rule_am", "00-5-03-sc-1") == "00-5-03-sc"
+    assert cached_serial_id("ra", "386") == "386"
+
+
+def test_resolve_citations(shared_datadir):
+    data = load_yaml(shared_datadir / "codification.yaml")
+    citations = collect_citations(data)
+    assert citations == {"220 Phil. 422", "230 Phil. 528"}
+    cache_clear()
+    resolved = resolve_citations(citations)
+    assert resolved["220 Phil. 422"] == "220 Phil. 422"
+    list(CodeUnit.create_branches(data["units"]))  # validators hit the cache
+    stats = cache_stats()["citation"]
+    assert stats.misses == 2
+    assert stats.hits == 2
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "2010-03-09",
+        "October 15, 1986",
+        "Oct 15, 1986",
+        "Oct. 15, 1986",
+        "15 October 1986",
+        "Sept. 5, 2000",
+        " March 9, 2010 ",
+    ],
+)
+def test_cached_date_matches_dateutil(text):
+    assert cached_date(text) == parse(text).date()
+
+
+def test_cached_date_passes_dates():
+    assert cached_date(datetime.date(2000, 1, 1)) == datetime.date(2000, 1, 1)
+
+
+def test_configure_caches(logged):
+    try:
+        configure_caches(citation=1)
+        assert cache_stats()["citation"].maxsize == 1
+        resolve_citations(["220 Phil. 422", "230 Phil. 528"])
+        assert cache_stats()["citation"].currsize == 1
+        assert "2 citations exceed the cache of 1" in logged[0]
+    finally:
+        configure_caches()
+    assert cached_citation.maxsize == 16384
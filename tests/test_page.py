@@ -0,0 +1,77 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from statute_trees import CodePage, CodeUnit, DocPage, DocUnit
+
+
+def test_units_derived_from_tree_on_access(civil_page: CodePage):
+    assert civil_page.__dict__["units"] is None  # not serialized by build()
+    expected = json.dumps([t.dict(exclude_none=True) for t in civil_page.tree])
+    assert civil_page.units == expected
+    assert civil_page.__dict__["units"] == expected  # cached
+
+
+def test_tree_derived_from_units_on_access(civil_page: CodePage):
+    stored = civil_page.dict(exclude={"tree"})
+    assert isinstance(stored["units"], str)
+    loaded = CodePage(**stored)
+    assert loaded.__dict__["tree"] is None
+    assert isinstance(loaded.tree[0], CodeUnit)
+    assert loaded.tree == civil_page.tree
+    assert loaded == civil_page
+
+
+def test_derived_when_iterated(civil_page: CodePage):
+    assert "units" in civil_page.copy().dict(exclude_unset=True)
+    assert "units=None" not in repr(civil_page.copy())
+    assert dict(civil_page)["units"] is not None
+    assert dict(civil_page)["units"] == civil_page.units
+
+
+def test_drop(civil_page: CodePage):
+    with pytest.raises(ValueError):
+        civil_page.drop("tree")  # units have not been derived yet
+    units = civil_page.units
+    civil_page.drop("tree")
+    assert civil_page.__dict__["tree"] is None
+    with pytest.raises(ValueError):
+        civil_page.drop("units")  # would lose both
+    assert isinstance(civil_page.tree[0], CodeUnit)  # derived from units
+    civil_page.drop("units")
+    assert civil_page.units == units
+
+
+def test_raw_units_derive_neither(civil_page: CodePage):
+    assert civil_page.raw_units() is civil_page.tree
+    assert civil_page.__dict__["units"] is None
+    units = civil_page.units
+    civil_page.drop("tree")
+    assert civil_page.raw_units() == json.loads(units)
+    assert civil_page.__dict__["tree"] is None
+
+
+def test_units_or_tree_required(civil_page: CodePage):
+    with pytest.raises(ValidationError):
+        CodePage(**civil_page.dict(exclude={"tree", "units"}))
+
+
+def test_trusted_units_match_validated(civil_page: CodePage):
+    units = civil_page.units
+    trusted = CodeUnit.load_branches(units, sample=1.0)
+    assert trusted == CodeUnit.load_branches(units, trusted=False)
+    assert trusted == civil_page.tree
+    assert json.dumps([t.dict(exclude_none=True) for t in trusted]) == units
+
+
+def test_trusted_sample_rejects_unclean_units():
+    units = json.dumps([{"item": "Sec. 1", "id": "1."}])
+    assert CodeUnit.load_branches(units)[0].item == "Sec. 1"  # not verified
+    with pytest.raises(ValueError):
+        CodeUnit.load_branches(units, sample=1.0)
+
+
+def test_trusted_document_sources(shared_datadir):
+    page = DocPage.build(shared_datadir / "document.yaml")
+    assert DocUnit.load_branches(page.units, sample=1.0) == page.tree
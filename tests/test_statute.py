@@ -1,3 +1,6 @@
+import copy
+import sys
+
 import pytest
 import yaml
 
@@ -105,6 +108,7 @@ def test_statute_unit_material_paths(statute_units):
             ],
             "statute_id": "pk_923452",
             "material_path": "1.1.",
+            "sort_key": "1111",
         },
         {
             "item": "Section 1",
@@ -120,6 +124,7 @@ def test_statute_unit_material_paths(statute_units):
             "units": [],
             "statute_id": "pk_923452",
             "material_path": "1.1.1.",
+            "sort_key": "111111",
         },
         {
             "item": "Section 2",
@@ -136,6 +141,7 @@ def test_statute_unit_material_paths(statute_units):
             "units": [],
             "statute_id": "pk_923452",
             "material_path": "1.1.2.",
+            "sort_key": "111112",
         },
     ]
 
@@ -144,11 +150,13 @@ def test_statute_unit_searchables(statute_units):
     assert list(StatuteUnit.searchables("pk_923452", statute_units)) == [
         {
             "material_path": "1.1.",
+            "sort_key": "1111",
             "statute_id": "pk_923452",
             "unit_text": "General Provisions.",
         },
         {
             "material_path": "1.1.1.",
+            "sort_key": "111111",
             "statute_id": "pk_923452",
             "unit_text": (
                 "Courts of justice to be maintained in every province.. Courts"
@@ -162,6 +170,7 @@ def test_statute_unit_searchables(statute_units):
         },
         {
             "material_path": "1.1.2.",
+            "sort_key": "111112",
             "statute_id": "pk_923452",
             "unit_text": (
                 "Constitution of judiciary. The judicial power of the"
@@ -174,3 +183,81 @@ def test_statute_unit_searchables(statute_units):
             ),
         },
     ]
+
+
+def test_statute_unit_create_branches_beyond_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    units: list[dict] = [{"item": "Article 1"}]
+    node = units[0]
+    for i in range(2, depth + 1):
+        node["units"] = [{"item": f"Article {i}"}]
+        node = node["units"][0]
+    unit = list(StatuteUnit.create_branches(units))[0]
+    while unit.units:
+        unit = unit.units[0]
+    assert unit.item == f"Article {depth}"
+    assert unit.id == "1." * (depth + 1)
+
+
+def test_statute_units_not_mutated(statute_obj, statute_units):
+    units = statute_obj["units"]
+    snapshot = copy.deepcopy(units)
+    assert list(StatuteUnit.create_branches(units, mutate=False)) == (
+        statute_units
+    )
+    assert units == snapshot
+
+
+def test_statute_unit_rows(statute_units):
+    rows = list(StatuteUnit.rows("pk_923452", statute_units))
+    granular = StatuteUnit.granularize("pk_923452", statute_units)
+    assert rows == [
+        (
+            "pk_923452",
+            g["material_path"],
+            g["item"],
+            g["caption"],
+            g["content"],
+        )
+        for g in granular
+    ]
+    assert list(StatuteUnit.rows("pk", statute_units, ("id",))) == [
+        ("pk", "1.1."),
+        ("pk", "1.1.1."),
+        ("pk", "1.1.2."),
+    ]
+
+
+@pytest.mark.parametrize("size, sizes", [(1, [1, 1, 1]), (2, [2, 1])])
+def test_statute_unit_row_batches(statute_units, size, sizes):
+    rows = list(StatuteUnit.rows("pk", statute_units))
+    batches = list(StatuteUnit.row_batches("pk", statute_units, size=size))
+    assert [len(b) for b in batches] == sizes
+    assert [r for b in batches for r in b] == rows
+    columns = list(
+        StatuteUnit.row_batches(
+            "pk", statute_units, ("id", "item"), size=size, columnar=True
+        )
+    )
+    assert [len(c[0]) for c in columns] == sizes
+    assert columns[0][0] == ("pk",) * size
+    assert [mp for c in columns for mp in c[1]] == [r[1] for r in rows]
+
+
+def test_statute_unit_granularize_deep_tree():
+    depth = sys.getrecursionlimit() // 4
+    units: list[dict] = [{"item": "Article 1"}]
+    node = units[0]
+    for i in range(2, depth + 1):
+        node["units"] = [{"item": f"Article {i}"}]
+        node = node["units"][0]
+    tree = list(StatuteUnit.create_branches(units))
+    rows = list(StatuteUnit.granularize("pk", tree))
+    assert len(rows) == depth == len(list(StatuteUnit.rows("pk", tree)))
+    child = tree[0].units[0]
+    assert rows[0]["units"][0] == child.dict()
+    assert rows[1] == child.dict(exclude={"id"}) | {
+        "statute_id": "pk",
+        "material_path": child.id,
+        "sort_key": child.sort_key,
+    }
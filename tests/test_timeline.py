@@ -0,0 +1,110 @@
+import datetime
+import pickle
+
+import pytest
+import yaml
+
+from statute_trees import CodePage, Timeline
+
+
+def event(action: str, date: str, locator: str = "Section 1") -> dict:
+    return dict(
+        locator=locator,
+        statute="Republic Act No. 386",
+        action=action,
+        date=date,
+    )
+
+
+@pytest.fixture
+def code(tmp_path) -> CodePage:
+    data = {
+        "title": "Sample Code",
+        "description": "Sample code whose units change over time.",
+        "date": "January 1, 2000",
+        "base": "Republic Act No. 386",
+        "units": [
+            {"item": "Article 1", "content": "Always in force."},
+            {
+                "item": "Article 2",
+                "content": "Amended, then repealed.",
+                "history": [
+                    event("Amended", "January 1, 2005"),
+                    event("Repealed", "January 1, 2010"),
+                ],
+                "units": [{"item": "Paragraph 1", "content": "Goes with it."}],
+            },
+            {
+                "item": "Article 3",
+                "content": "Inserted, then deleted.",
+                "history": [
+                    event("Inserted", "January 1, 2003"),
+                    event("Deleted", "January 1, 2008"),
+                ],
+            },
+            {
+                "item": "Article 4",
+                "content": "Vetoed.",
+                "history": [event("Vetoed", "January 1, 2001")],
+            },
+            {
+                "item": "Article 5",
+                "content": "Undated events are ignored.",
+                "history": [{"locator": "Section 2", "statute": "Act No. 1"}],
+            },
+        ],
+    }
+    (path := tmp_path / "code.yaml").write_text(yaml.safe_dump(data))
+    return CodePage.build(path)
+
+
+@pytest.mark.parametrize(
+    "date, expected",
+    [
+        ("1999-12-31", []),
+        (
+            "2000-01-01",
+            ["1.", "1.1.", "1.2.", "1.2.1.", "1.5."],
+        ),
+        (
+            "2003-06-30",
+            ["1.", "1.1.", "1.2.", "1.2.1.", "1.3.", "1.5."],
+        ),
+        (
+            "2008-01-01",
+            ["1.", "1.1.", "1.2.", "1.2.1.", "1.5."],
+        ),
+        ("2010-01-01", ["1.", "1.1.", "1.5."]),
+        ("2030-01-01", ["1.", "1.1.", "1.5."]),
+    ],
+)
+def test_timeline_as_of(code, date, expected):
+    timeline = Timeline(code)
+    on = datetime.date.fromisoformat(date)
+    assert timeline.as_of(on) == expected
+    assert [timeline.in_force(mp, on) for mp in timeline.ids] == [
+        mp in expected for mp in timeline.ids
+    ]
+
+
+def test_timeline_snapshots_are_cached(code):
+    timeline = Timeline(code)
+    assert timeline.boundaries == [
+        datetime.date(2000, 1, 1),
+        datetime.date(2003, 1, 1),
+        datetime.date(2008, 1, 1),
+        datetime.date(2010, 1, 1),
+    ]
+    dates = [datetime.date(y, 6, 1) for y in range(2011, 1998, -1)]
+    expected = [Timeline(code).as_of(d) for d in dates]  # each from scratch
+    assert [timeline.as_of(d) for d in dates] == expected
+    assert set(timeline._cache) == {-1, 0, 1, 2, 3}
+
+
+def test_timeline_from_units_json(code):
+    expected = Timeline(code).as_of(datetime.date(2004, 1, 1))
+    code.units
+    code.drop("tree")
+    page = pickle.loads(pickle.dumps(code))
+    assert Timeline(page).as_of(datetime.date(2004, 1, 1)) == expected
+    assert page.__dict__["tree"] is None
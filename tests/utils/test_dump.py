@@ -0,0 +1,48 @@
+import json
+import sys
+
+import pytest
+
+from statute_trees import CodePage, DocPage, StatutePage
+from statute_trees.utils import dump_units
+from statute_trees.utils.dump import _dump_deep
+
+
+@pytest.mark.parametrize(
+    "page_cls, path",
+    [
+        (CodePage, "codification.yaml"),
+        (DocPage, "document.yaml"),
+        (StatutePage, "statutes/const/1987/details.yaml"),
+    ],
+)
+def test_dump_units_matches_dict_then_json(data_dir, page_cls, path):
+    tree = page_cls.build(data_dir / path).tree
+    assert dump_units(tree) == json.dumps(
+        [t.dict(exclude_none=True) for t in tree]
+    )
+
+
+def test_dump_units_plain_values():
+    data = [{"a": None, "b": [True, False, 1, 1.5], "ñ": "Tañada"}]
+    assert dump_units(data) == json.dumps(data)
+    assert dump_units(data, ensure_ascii=False) == json.dumps(
+        data, ensure_ascii=False
+    )
+
+
+def test_dump_units_rejects_unknown_objects():
+    with pytest.raises(TypeError):
+        dump_units([object()])
+
+
+def test_dump_units_beyond_recursion_limit():
+    depth = sys.getrecursionlimit()
+    nodes: list = []
+    for i in range(depth):
+        nodes = [{"item": f"Item {i}", "units": nodes, "ñ": [1.5, None]}]
+    text = dump_units(nodes)
+    assert text.startswith(f'[{{"item": "Item {depth - 1}", "units": [')
+    assert text.endswith('"\\u00f1": [1.5, null]}]')
+    assert text == "".join(_dump_deep(nodes))
+    assert dump_units(nodes[0]["units"][:1]) in text
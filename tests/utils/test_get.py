@@ -1,6 +1,6 @@
 import pytest
 
-from statute_trees.utils import get_node_id
+from statute_trees.utils import get_node_id, get_node_ids, set_node_ids
 
 
 @pytest.fixture
@@ -51,3 +51,68 @@ def test_get_node_id(id_data):
         ),
         "id": "1.1.1.1",
     }
+
+
+@pytest.fixture
+def big_tree() -> list[dict]:
+    tree = [
+        {"item": f"Title {a}", "units": [{"item": f"Article {b}"}]}
+        for a in range(1, 6)
+        for b in range(1, 4)
+    ]
+    for node in tree:
+        node["units"][0]["units"] = [{"item": "Paragraph 1"}]
+    set_node_ids(tree)
+    return tree
+
+
+@pytest.mark.parametrize(
+    "query_id, item",
+    [
+        ("1.1.", "Title 1"),
+        ("1.15.", "Title 5"),
+        ("1.7.1.", "Article 1"),
+        ("1.7.1.1.", "Paragraph 1"),
+    ],
+)
+def test_get_node_id_positional(big_tree, query_id, item):
+    node = get_node_id(big_tree, query_id)
+    assert node and node["item"] == item
+    assert node["id"] == query_id
+
+
+@pytest.mark.parametrize(
+    "query_id", ["1.16.", "1.1.2.", "2.1.", "1.x.", "1.7.1.1", ""]
+)
+def test_get_node_id_missing(big_tree, query_id):
+    assert get_node_id(big_tree, query_id) is None
+
+
+def test_get_node_id_non_positional():
+    nodes = [
+        {
+            "id": "a",
+            "units": [{"id": "b"}, {"id": "c", "units": [{"id": "d"}]}],
+        }
+    ]
+    assert get_node_id(nodes, "d") == {"id": "d"}
+    assert get_node_id(nodes, "1.1.") is None
+
+
+def test_get_node_id_custom_child_key():
+    nodes = [{"item": "A", "children": [{"item": "B"}, {"item": "C"}]}]
+    set_node_ids(nodes, parent_id="x.", child_key="children")
+    assert get_node_id(nodes, "x.1.2.", child_key="children") == {
+        "item": "C",
+        "id": "x.1.2.",
+    }
+
+
+def test_get_node_ids(big_tree):
+    nodes = [*big_tree, {"item": "Stray", "id": "stray"}]
+    found = get_node_ids(nodes, ["1.7.1.1.", "stray", "1.99.", "1.1."])
+    assert list(found) == ["1.7.1.1.", "stray", "1.99.", "1.1."]
+    assert found["1.7.1.1."]["item"] == "Paragraph 1"  # type: ignore
+    assert found["stray"]["item"] == "Stray"  # type: ignore
+    assert found["1.99."] is None
+    assert found["1.1."]["item"] == "Title 1"  # type: ignore
@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from statute_trees.utils import TreeIndex, get_node_id, set_node_ids
+from statute_trees.utils.get import _search
+
+
+@pytest.fixture
+def nodes() -> list[dict]:
+    data = [
+        {"item": "Title 1", "units": [{"item": "Art. 1"}, {"item": "Art. 2"}]},
+        {
+            "item": "Title 2",
+            "units": [
+                {"item": "Art. 3", "units": [{"item": "Par. 1"}]},
+                {"item": "Art. 4"},
+            ],
+        },
+        {"item": "Title 3"},
+    ]
+    set_node_ids(data)
+    return data
+
+
+@pytest.fixture
+def index(nodes) -> TreeIndex:
+    return TreeIndex.from_nodes(nodes)
+
+
+def test_tree_index_preorder(index):
+    assert index.ids == [
+        "1.1.",
+        "1.1.1.",
+        "1.1.2.",
+        "1.2.",
+        "1.2.1.",
+        "1.2.1.1.",
+        "1.2.2.",
+        "1.3.",
+    ]
+    assert index.parents == [-1, 0, 0, -1, 3, 4, 3, -1]
+    assert index.ends == [3, 2, 3, 7, 6, 6, 7, 8]
+    assert len(index) == 8
+    assert "1.2.1.1." in index and "1.4." not in index
+
+
+def test_tree_index_lookup(index, nodes):
+    assert index["1.2.1.1."] is get_node_id(nodes, "1.2.1.1.")
+    assert index.get("1.9.") is None
+    with pytest.raises(KeyError):
+        index["1.9."]
+
+
+def test_tree_index_navigation(index):
+    items = lambda units: [u["item"] for u in units]  # noqa: E731
+    assert index.parent("1.1.") is None
+    assert index.parent("1.2.1.1.")["item"] == "Art. 3"
+    assert items(index.ancestors("1.2.1.1.")) == ["Title 2", "Art. 3"]
+    assert index.ancestors("1.3.") == []
+    assert items(index.children("1.2.")) == ["Art. 3", "Art. 4"]
+    assert index.children("1.3.") == []
+    assert items(index.siblings("1.2.")) == ["Title 1", "Title 3"]
+    assert items(index.siblings("1.2.2.", include_self=True)) == [
+        "Art. 3",
+        "Art. 4",
+    ]
+
+
+def test_tree_index_subtree(index):
+    assert index.span("1.2.") == range(3, 7)
+    assert index.subtree_ids("1.2.") == [
+        "1.2.",
+        "1.2.1.",
+        "1.2.1.1.",
+        "1.2.2.",
+    ]
+    assert index.subtree_ids("1.2.", include_self=False)[0] == "1.2.1."
+    assert [n["item"] for n in index.subtree("1.1.")] == [
+        "Title 1",
+        "Art. 1",
+        "Art. 2",
+    ]
+
+
+def test_tree_index_models_and_json(civil_page):
+    page = civil_page
+    models = TreeIndex.from_nodes(page.tree)
+    dicts = TreeIndex.from_json(page.units)
+    assert models.ids == dicts.ids
+    assert models.parents == dicts.parents
+    assert models.ends == dicts.ends
+    assert [u["id"] for u in _search(json.loads(page.units), "units")] == (
+        models.ids
+    )
+    for node_id in models.ids:
+        assert models[node_id].item == dicts[node_id]["item"]
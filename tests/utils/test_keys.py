@@ -0,0 +1,34 @@
+import pytest
+
+from statute_trees.utils import from_sort_key, subtree_range, to_sort_key
+
+
+@pytest.mark.parametrize(
+    "material_path, key",
+    [
+        ("1.", "11"),
+        ("1.2.", "1112"),
+        ("1.10.", "111a"),
+        ("1.36.", "11210"),
+        ("1.3.2.", "111312"),
+        ("1.1295.1.", "112zz11"),
+    ],
+)
+def test_sort_key_round_trip(material_path, key):
+    assert to_sort_key(material_path) == key
+    assert from_sort_key(key) == material_path
+
+
+def test_sort_keys_in_pre_order():
+    paths = ["1.", "1.1.", "1.1.9.", "1.1.10.", "1.2.", "1.9.", "1.10."]
+    paths += ["1.10.1.", "1.36.", "1.100.", "1.1000.", "1.1000.2."]
+    assert sorted(paths) != paths
+    assert sorted(paths, key=to_sort_key) == paths
+
+
+def test_subtree_range():
+    start, end = subtree_range("1.1.")
+    inside = ["1.1.", "1.1.1.", "1.1.10.", "1.1.40.300."]
+    outside = ["1.", "1.2.", "1.10.", "1.11."]
+    assert all(start <= to_sort_key(p) < end for p in inside)
+    assert not any(start <= to_sort_key(p) < end for p in outside)
@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from statute_trees.utils import Layers
@@ -100,3 +102,14 @@ def test_layered_items(itemless_data):
             ],
         }
     ]
+
+
+def test_layerize_beyond_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    nodes: list[dict] = [{"item": "Item 1"}]
+    node = nodes[0]
+    for _ in range(depth):
+        units = node["units"] = [{"item": "Item"}, {"caption": "Unlabeled"}]
+        node = units[0]
+    Layers.DEFAULT.layerize(nodes)
+    assert units[1]["item"] == "§II"  # the first level with labels added
@@ -0,0 +1,42 @@
+import yaml
+
+from statute_trees import CodePage, DocPage
+from statute_trees.utils import iter_units, load_header, load_yaml
+
+
+def test_load_yaml(data_dir):
+    p = data_dir / "codification.yaml"
+    assert load_yaml(p) == yaml.safe_load(p.read_text())
+
+
+def test_streamed_units(data_dir):
+    p = data_dir / "codification.yaml"
+    data = yaml.safe_load(p.read_text())
+    header = load_header(p)
+    assert "units" not in header
+    assert header == {k: v for k, v in data.items() if k != "units"}
+    assert list(iter_units(p)) == data["units"]
+
+
+def test_streamed_build(data_dir):
+    code = data_dir / "codification.yaml"
+    assert CodePage.build(code, stream=True) == CodePage.build(code)
+    doc = data_dir / "document.yaml"
+    assert DocPage.build(doc, stream=True) == DocPage.build(doc)
+
+
+def test_streamed_units_alias_header_anchors(tmp_path):
+    p = tmp_path / "aliased.yaml"
+    p.write_text(
+        "base: &base\n"
+        "  content: Shared.\n"
+        "units:\n"
+        "  - &first\n"
+        "    item: Article 1\n"
+        "    <<: *base\n"
+        "  - *first\n"
+        "after: *first\n"
+    )
+    data = yaml.safe_load(p.read_text())
+    assert list(iter_units(p)) == data["units"]
+    assert load_header(p) == {k: v for k, v in data.items() if k != "units"}
@@ -0,0 +1,111 @@
+import copy
+import json
+
+import pytest
+
+from statute_trees import DocPage
+from statute_trees.utils import TreeHashes, diff_trees, set_node_ids
+
+
+@pytest.fixture
+def units() -> list[dict]:
+    chapters = [
+        {
+            "item": f"Chapter {c}",
+            "units": [
+                {"item": f"Section {s}", "content": f"Text {c}.{s}"}
+                for s in range(1, 6)
+            ],
+        }
+        for c in range(1, 4)
+    ]
+    set_node_ids(chapters)
+    return chapters
+
+
+def changed(units: list[dict], edit) -> TreeHashes:
+    units = copy.deepcopy(units)
+    edit(units)
+    set_node_ids(units)
+    return TreeHashes(units)
+
+
+def test_tree_hashes_match_models_and_json(civil_page, data_dir):
+    for page in (civil_page, DocPage.build(data_dir / "document.yaml")):
+        from_models = TreeHashes(page.tree)
+        from_json = TreeHashes.from_json(page.units)
+        assert from_models.digests == from_json.digests
+        assert from_models.root == from_json.root
+        assert len(set(from_models.digests)) == len(from_models)
+
+
+def test_tree_hashes_cover_content_and_children(units):
+    hashes = TreeHashes(units)
+
+    def edit(u):
+        u[1]["units"][2]["content"] = "Changed"
+
+    other = changed(units, edit)
+    assert other.root != hashes.root
+    same = [p for p in hashes.ids if hashes.hexdigest(p) == other.hexdigest(p)]
+    assert set(hashes.ids) - set(same) == {"1.2.", "1.2.3."}
+    assert hashes.own[hashes.pos["1.2."]] == other.own[other.pos["1.2."]]
+
+
+def test_diff_identical_trees(units):
+    hashes = TreeHashes(units)
+    assert diff_trees(hashes, TreeHashes(copy.deepcopy(units))) == (
+        [],
+        [],
+        [],
+        [],
+    )
+
+
+def test_diff_modified_added_removed(units):
+    def edit(u):
+        u[0]["units"][1]["content"] = "Changed"
+        u[1]["units"].append({"item": "Section 6", "content": "New"})
+        del u[2]["units"][4]
+
+    diff = diff_trees(TreeHashes(units), changed(units, edit))
+    assert diff.modified == [("1.1.2.", "1.1.2.")]
+    assert diff.added == ["1.2.6."]
+    assert diff.removed == ["1.3.5."]
+    assert diff.moved == []
+
+
+def test_diff_moved(units):
+    def edit(u):
+        u[0]["units"].insert(0, {"item": "Section 0", "content": "New"})
+        u[2]["units"].append(u[1]["units"].pop(0))
+
+    diff = diff_trees(TreeHashes(units), changed(units, edit))
+    assert diff.added == ["1.1.1."]
+    assert diff.removed == []
+    assert diff.modified == []
+    assert sorted(diff.moved) == sorted(
+        [(f"1.1.{s}.", f"1.1.{s + 1}.") for s in range(1, 6)]  # renumbered
+        + [(f"1.2.{s + 1}.", f"1.2.{s}.") for s in range(1, 5)]
+        + [("1.2.1.", "1.3.6.")]  # to another parent
+    )
+
+
+def test_diff_renumbered_parent_keeps_children(units):
+    def edit(u):
+        u.insert(0, {"item": "Chapter 0", "content": "New"})
+        u[2]["caption"] = "Now with a caption"
+
+    diff = diff_trees(TreeHashes(units), changed(units, edit))
+    assert diff.added == ["1.1."]
+    assert diff.modified == [("1.2.", "1.3.")]
+    assert sorted(diff.moved) == [("1.1.", "1.2."), ("1.3.", "1.4.")]
+
+
+def test_diff_of_page_versions(civil_page):
+    page = civil_page
+    units = json.loads(page.units)
+    units[0]["units"][0]["units"][0]["units"][1]["history"].pop()
+    diff = diff_trees(TreeHashes(page.tree), TreeHashes(units))
+    assert diff.modified == [("1.1.1.2.", "1.1.1.2.")]  # Article 2
+    assert not diff.added and not diff.removed and not diff.moved
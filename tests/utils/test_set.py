@@ -1,6 +1,9 @@
+import sys
+from collections.abc import Iterator
+
 import pytest
 
-from statute_trees.utils import set_node_ids
+from statute_trees.utils import build_branches, set_node_ids
 
 
 @pytest.fixture
@@ -75,3 +78,55 @@ def test_set_node_ids(raw_data):
             ],
         }
     ]
+
+
+def chain(depth: int) -> list[dict]:
+    root: dict = {"item": "Item 1"}
+    node = root
+    for i in range(2, depth + 1):
+        node["units"] = [{"item": f"Item {i}"}]
+        node = node["units"][0]
+    return [root]
+
+
+def test_set_node_ids_beyond_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    nodes = chain(depth)
+    set_node_ids(nodes)
+    node = nodes[0]
+    while "units" in node:
+        node = node["units"][0]
+    assert node["id"] == "1." * (depth + 1)
+
+
+def test_build_branches(raw_data):
+    made = build_branches(
+        raw_data,
+        lambda u, id, children: (u["item"], id, children),
+    )
+    assert isinstance(made, Iterator)
+    assert list(made) == [
+        (
+            "Preliminary Title",
+            "1.1.",
+            [
+                (
+                    "Chapter 1",
+                    "1.1.1.",
+                    [
+                        ("Article 1", "1.1.1.1.", []),
+                        ("Article 2", "1.1.1.2.", []),
+                    ],
+                )
+            ],
+        )
+    ]
+
+
+def test_build_branches_beyond_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    made = build_branches(chain(depth), lambda u, id, children: children)
+    node, levels = list(made), 0
+    while node:
+        node, levels = node[0], levels + 1
+    assert levels == depth
@@ -1,6 +1,18 @@
+import copy
+
 import pytest
+import yaml
+from pydantic import BaseModel
 
-from statute_trees.utils import fetch_values_from_key
+from statute_trees import CodeUnit
+from statute_trees.utils import (
+    fetch_values_from_key,
+    get_field,
+    get_node_id,
+    preorder,
+    walk_keys,
+)
+from statute_trees.utils.walk import Hit
 
 
 @pytest.fixture
@@ -52,3 +64,75 @@ def test_fetch_values_from_key(raw_data):
 def test_cant_fetch_values_from_list(raw_data):
     fetch_values_from_key(raw_data, "item")
     assert AttributeError
+
+
+def test_fetch_values_from_key_skips_scalars_in_lists():
+    data = {"tags": ["a", 1], "units": [{"item": "Article 1"}]}
+    assert list(fetch_values_from_key(data, "item")) == ["Article 1"]
+
+
+def test_fetch_values_from_key_in_nested_lists():
+    data = {"a": [[{"item": "Article 1"}, ["x", {"item": "Article 2"}]]]}
+    values = fetch_values_from_key(data, "item")
+    assert sorted(values) == ["Article 1", "Article 2"]
+
+
+@pytest.fixture
+def code_units(data_dir) -> list[dict]:
+    p = data_dir / "codification.yaml"
+    return yaml.safe_load(p.read_text())["units"]
+
+
+def test_walk_keys_in_one_pass(code_units):
+    hits = list(walk_keys(code_units, ("history", "faq"), child_key="units"))
+    assert {h.key for h in hits} == {"history", "faq"}
+    separate = [
+        (h.material_path, h.value)
+        for key in ("history", "faq")
+        for h in walk_keys(code_units, key, child_key="units")
+    ]
+    assert sorted(separate, key=str) == sorted(
+        [(h.material_path, h.value) for h in hits], key=str
+    )
+
+
+def test_walk_keys_paths_match_built_tree(code_units):
+    raw = list(walk_keys(code_units, "history", child_key="units"))
+    tree = list(CodeUnit.create_branches(copy.deepcopy(code_units)))
+    built = list(walk_keys(tree, "history", child_key="units"))
+    assert raw and [h.material_path for h in raw] == [
+        h.material_path for h in built
+    ]
+    assert all(isinstance(h.value[0], BaseModel) for h in built)
+    assert get_node_id(
+        [t.dict() for t in tree], raw[0].material_path  # type: ignore
+    )["history"]
+
+
+def test_walk_keys_without_child_key():
+    data = {
+        "id": "1.1.",
+        "history": [{"citation": "1 SCRA 1", "units": [{"history": 1}]}],
+        "other": [[{"id": "1.2.", "history": "x"}], {"history": None}],
+    }
+    assert list(walk_keys(data, "history")) == [
+        Hit("1.1.", "history", data["history"]),
+        Hit("1.1.", "history", 1),
+        Hit("1.2.", "history", "x"),
+    ]
+    assert list(walk_keys(data, "history", child_key="units")) == [
+        Hit("1.1.", "history", data["history"])
+    ]
+
+
+def test_get_field_of_dict_or_model():
+    unit = CodeUnit(id="1.", item="Article 1", content="Text.")
+    assert get_field(unit, "item") == get_field(unit.dict(), "item")
+    assert get_field(unit, "missing") is get_field({}, "missing") is None
+
+
+def test_preorder_positions_and_parents():
+    nodes = [{"id": "a", "units": [{"id": "b", "units": [{"id": "c"}]}]}]
+    nodes.append({"id": "d"})
+    found = [(pos, parent, n["id"]) for pos, parent, n in preorder(nodes)]
+    assert found == [(0, -1, "a"), (1, 0, "b"), (2, 1, "c"), (3, -1, "d")]